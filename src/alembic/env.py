@@ -2,7 +2,7 @@
 import asyncio
 from logging.config import fileConfig
 
-from sqlalchemy import pool
+from sqlalchemy import inspect, insert, pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
@@ -10,7 +10,8 @@ from alembic import context
 
 # Import models and config
 from bot.config import config as app_config
-from bot.database.models import Base
+from bot.database.models import Base, SessionStatus
+from bot.database.status_manager import DEFAULT_STATUSES
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -58,12 +59,42 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def _is_fresh_install(connection: Connection) -> bool:
+    """Check for an opted-in upgrade to head against a database with no tables.
+
+    The shortcut is explicit: ``alembic -x fresh=1 upgrade head`` on the
+    command line, or ``config.attributes["fresh_install"] = True`` when
+    calling ``alembic.command.upgrade`` programmatically.
+    """
+    x_args = context.get_x_argument(as_dictionary=True)
+    requested = x_args.get("fresh") == "1" or config.attributes.get("fresh_install")
+    if not requested:
+        return False
+    if context.get_revision_argument() != context.script.get_current_head():
+        return False
+    return not inspect(connection).get_table_names()
+
+
+def _create_fresh_schema(connection: Connection) -> None:
+    """Build the current schema from the models and stamp it as head.
+
+    Fresh deploys skip replaying the whole migration chain, which
+    re-alters the same tables once per revision.
+    """
+    target_metadata.create_all(connection)
+    connection.execute(insert(SessionStatus), DEFAULT_STATUSES)
+    context.get_context().stamp(context.script, "head")
+
+
 def do_run_migrations(connection: Connection) -> None:
     """Run migrations with the given connection."""
     context.configure(connection=connection, target_metadata=target_metadata)
 
     with context.begin_transaction():
-        context.run_migrations()
+        if _is_fresh_install(connection):
+            _create_fresh_schema(connection)
+        else:
+            context.run_migrations()
 
 
 async def run_async_migrations() -> None:
@@ -18,152 +18,216 @@ down_revision: Union[str, None] = '000'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Rows per committed batch for the data backfills below
+BACKFILL_BATCH_SIZE = 10000
+
+
+def _backfill_in_batches(table: str, update_sql: str) -> None:
+    """Run a backfill UPDATE over ``table`` in committed id-range batches.
+
+    ``update_sql`` must end with a WHERE clause; the id range condition
+    is appended to it.  Each batch commits on its own so row locks and
+    WAL usage stay bounded by the batch size.  Batch commits skip the
+    WAL fsync wait (``synchronous_commit = off``), so a crash can lose
+    the last few committed batches.  Entering the block also commits
+    the DDL run before it, so after any failure the revision is left
+    partly applied with alembic_version unchanged; ``upgrade()`` keeps
+    its steps idempotent so that the re-run redoes the lost work.
+    """
+    conn = op.get_bind()
+    bounds = conn.execute(
+        sa.text(f"SELECT min(id), max(id) FROM {table}")
+    ).one()
+    if bounds[0] is None:
+        return
+
+    statement = sa.text(f"{update_sql} AND {table}.id BETWEEN :lo AND :hi")
+    with op.get_context().autocommit_block():
+        conn.execute(sa.text("SET synchronous_commit = off"))
+        try:
+            for lo in range(bounds[0], bounds[1] + 1, BACKFILL_BATCH_SIZE):
+                conn.execute(statement, {"lo": lo, "hi": lo + BACKFILL_BATCH_SIZE - 1})
+        finally:
+            conn.execute(sa.text("RESET synchronous_commit"))
+
+
+def _create_index_concurrently(name: str, definition: str) -> None:
+    """CREATE INDEX CONCURRENTLY ``name`` ON ``definition``, re-runnably.
+
+    A failed concurrent build leaves an INVALID index behind, which
+    ``IF NOT EXISTS`` would then silently keep.  Such a leftover is
+    dropped first so the re-run builds a usable index.  Must run inside
+    an autocommit block.
+    """
+    invalid = op.get_bind().execute(
+        sa.text(
+            "SELECT NOT indisvalid FROM pg_index "
+            "WHERE indexrelid = to_regclass(:name)"
+        ),
+        {"name": name},
+    ).scalar()
+    if invalid:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}")
+
+
+def _column_exists(table: str, column: str) -> bool:
+    """Return True if ``table`` currently has ``column``."""
+    return bool(op.get_bind().execute(
+        sa.text(
+            "SELECT 1 FROM information_schema.columns "
+            "WHERE table_schema = current_schema() "
+            "AND table_name = :table AND column_name = :column"
+        ),
+        {"table": table, "column": column},
+    ).scalar())
+
 
 def upgrade() -> None:
-    """Upgrade database schema."""
+    """Upgrade database schema.
+
+    The autocommit blocks below commit everything before them, so a
+    failure after one leaves a partly applied revision behind while
+    alembic_version still says 000.  Every step up to the final
+    constraint swap is therefore idempotent and safe to re-run; that
+    includes the concurrent index builds, which replace an INVALID
+    index left by a failed build (see _create_index_concurrently).
+    """
     
     # 1. Create session_statuses table
-    op.create_table(
-        'session_statuses',
-        sa.Column('id', sa.Integer(), nullable=False),
-        sa.Column('code', sa.String(length=50), nullable=False),
-        sa.Column('name', sa.String(length=100), nullable=False),
-        sa.Column('description', sa.String(length=500), nullable=True),
-        sa.PrimaryKeyConstraint('id'),
-        sa.UniqueConstraint('code')
-    )
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS session_statuses (
+            id SERIAL PRIMARY KEY,
+            code VARCHAR(50) NOT NULL UNIQUE,
+            name VARCHAR(100) NOT NULL,
+            description VARCHAR(500)
+        )
+    """)
     
-    # 2. Insert default statuses
+    # 2. Insert default statuses (single multi-row INSERT)
     op.execute("""
         INSERT INTO session_statuses (code, name, description) VALUES
-        ('collecting', 'Сбор предложений', 'Участники предлагают фильмы для голосования'),
-        ('voting', 'Голосование', 'Идет голосование за предложенные фильмы'),
-        ('rating', 'Выставление рейтингов', 'Участники оценивают просмотренные фильмы'),
-        ('completed', 'Завершена', 'Сессия завершена')
+            ('collecting', 'Сбор предложений',
+             'Участники предлагают фильмы для голосования'),
+            ('voting', 'Голосование',
+             'Идет голосование за предложенные фильмы'),
+            ('rating', 'Выставление рейтингов',
+             'Участники оценивают просмотренные фильмы'),
+            ('completed', 'Завершена', 'Сессия завершена')
+        ON CONFLICT (code) DO NOTHING
     """)
     
-    # 3. Add status_id to sessions table
-    op.add_column('sessions', sa.Column('status_id', sa.Integer(), nullable=True))
-    
+    # Each relation column below touches its table with two ALTERs: one
+    # adding the nullable column together with its FK, and one (after the
+    # batched backfill) applying NOT NULL and the constraint swaps.
+
+    # 3. Add status_id (+ FK) to sessions
+    op.execute("""
+        ALTER TABLE sessions
+        ADD COLUMN IF NOT EXISTS status_id INTEGER
+            CONSTRAINT fk_sessions_status REFERENCES session_statuses (id)
+    """)
+
     # 4. Migrate data: set status_id based on old status field
+    #    (already done if a previous run got past step 5)
+    if _column_exists('sessions', 'status'):
+        _backfill_in_batches('sessions', """
+            UPDATE sessions
+            SET status_id = s.id
+            FROM session_statuses s
+            WHERE s.code = sessions.status
+        """)
+
+    # 5. Make status_id NOT NULL and drop the old status column
     op.execute("""
-        UPDATE sessions
-        SET status_id = (
-            SELECT id FROM session_statuses 
-            WHERE code = sessions.status
-        )
+        ALTER TABLE sessions
+        ALTER COLUMN status_id SET NOT NULL,
+        DROP COLUMN IF EXISTS status
     """)
-    
-    # 5. Make status_id NOT NULL
-    op.alter_column('sessions', 'status_id', nullable=False)
-    
-    # 6. Add foreign key
-    op.create_foreign_key(
-        'fk_sessions_status', 
-        'sessions', 
-        'session_statuses',
-        ['status_id'], 
-        ['id']
-    )
-    
-    # 7. Drop old status column
-    op.drop_column('sessions', 'status')
-    
-    # 8. Add session_id to votes table
-    op.add_column('votes', sa.Column('session_id', sa.Integer(), nullable=True))
-    
-    # 9. Populate session_id in votes from movies
+
+    # 6. Add session_id (+ FK) to votes and ratings
     op.execute("""
-        UPDATE votes
-        SET session_id = (
-            SELECT session_id FROM movies
-            WHERE movies.id = votes.movie_id
-        )
+        ALTER TABLE votes
+        ADD COLUMN IF NOT EXISTS session_id INTEGER
+            CONSTRAINT fk_votes_session REFERENCES sessions (id)
     """)
-    
-    # 10. Make session_id NOT NULL
-    op.alter_column('votes', 'session_id', nullable=False)
-    
-    # 11. Add foreign key for votes
-    op.create_foreign_key(
-        'fk_votes_session',
-        'votes',
-        'sessions',
-        ['session_id'],
-        ['id']
-    )
-    
-    # 12. Drop old constraint and add new one for votes
-    op.drop_constraint('uq_movie_user_vote', 'votes', type_='unique')
-    op.create_unique_constraint(
-        'uq_session_movie_user_vote',
-        'votes',
-        ['session_id', 'movie_id', 'user_id']
-    )
-    
-    # 13. Add session_id to ratings table
-    op.add_column('ratings', sa.Column('session_id', sa.Integer(), nullable=True))
-    
-    # 14. Populate session_id in ratings from movies
     op.execute("""
+        ALTER TABLE ratings
+        ADD COLUMN IF NOT EXISTS session_id INTEGER
+            CONSTRAINT fk_ratings_session REFERENCES sessions (id)
+    """)
+
+    # 7. Index movie_id on votes/ratings so the backfill joins avoid seq-scans
+    with op.get_context().autocommit_block():
+        _create_index_concurrently("ix_votes_movie_id", "votes (movie_id)")
+        _create_index_concurrently("ix_ratings_movie_id", "ratings (movie_id)")
+
+    # 8. Populate session_id in votes and ratings from movies
+    _backfill_in_batches('votes', """
+        UPDATE votes
+        SET session_id = m.session_id
+        FROM movies m
+        WHERE m.id = votes.movie_id AND votes.session_id IS NULL
+    """)
+    _backfill_in_batches('ratings', """
         UPDATE ratings
-        SET session_id = (
-            SELECT session_id FROM movies
-            WHERE movies.id = ratings.movie_id
-        )
+        SET session_id = m.session_id
+        FROM movies m
+        WHERE m.id = ratings.movie_id AND ratings.session_id IS NULL
+    """)
+
+    # 9. Make session_id NOT NULL and swap the unique constraints
+    op.execute("""
+        ALTER TABLE votes
+        ALTER COLUMN session_id SET NOT NULL,
+        DROP CONSTRAINT uq_movie_user_vote,
+        ADD CONSTRAINT uq_session_movie_user_vote
+            UNIQUE (session_id, movie_id, user_id)
+    """)
+    op.execute("""
+        ALTER TABLE ratings
+        ALTER COLUMN session_id SET NOT NULL,
+        DROP CONSTRAINT uq_movie_user_rating,
+        ADD CONSTRAINT uq_session_movie_user_rating
+            UNIQUE (session_id, movie_id, user_id)
     """)
-    
-    # 15. Make session_id NOT NULL
-    op.alter_column('ratings', 'session_id', nullable=False)
-    
-    # 16. Add foreign key for ratings
-    op.create_foreign_key(
-        'fk_ratings_session',
-        'ratings',
-        'sessions',
-        ['session_id'],
-        ['id']
-    )
-    
-    # 17. Drop old constraint and add new one for ratings
-    op.drop_constraint('uq_movie_user_rating', 'ratings', type_='unique')
-    op.create_unique_constraint(
-        'uq_session_movie_user_rating',
-        'ratings',
-        ['session_id', 'movie_id', 'user_id']
-    )
 
 
 def downgrade() -> None:
     """Downgrade database schema."""
     
+    op.drop_index('ix_ratings_movie_id', table_name='ratings')
+    op.drop_index('ix_votes_movie_id', table_name='votes')
+
     # Ratings: revert changes
-    op.drop_constraint('uq_session_movie_user_rating', 'ratings', type_='unique')
-    op.create_unique_constraint('uq_movie_user_rating', 'ratings', ['movie_id', 'user_id'])
-    op.drop_constraint('fk_ratings_session', 'ratings', type_='foreignkey')
-    op.drop_column('ratings', 'session_id')
-    
+    with op.batch_alter_table('ratings') as batch_op:
+        batch_op.drop_constraint('uq_session_movie_user_rating', type_='unique')
+        batch_op.create_unique_constraint('uq_movie_user_rating', ['movie_id', 'user_id'])
+        batch_op.drop_constraint('fk_ratings_session', type_='foreignkey')
+        batch_op.drop_column('session_id')
+
     # Votes: revert changes
-    op.drop_constraint('uq_session_movie_user_vote', 'votes', type_='unique')
-    op.create_unique_constraint('uq_movie_user_vote', 'votes', ['movie_id', 'user_id'])
-    op.drop_constraint('fk_votes_session', 'votes', type_='foreignkey')
-    op.drop_column('votes', 'session_id')
-    
+    with op.batch_alter_table('votes') as batch_op:
+        batch_op.drop_constraint('uq_session_movie_user_vote', type_='unique')
+        batch_op.create_unique_constraint('uq_movie_user_vote', ['movie_id', 'user_id'])
+        batch_op.drop_constraint('fk_votes_session', type_='foreignkey')
+        batch_op.drop_column('session_id')
+
     # Sessions: revert changes
     op.add_column('sessions', sa.Column('status', sa.String(length=50), nullable=True))
-    
+
     # Restore status values from status_id
     op.execute("""
         UPDATE sessions
-        SET status = (
-            SELECT code FROM session_statuses
-            WHERE id = sessions.status_id
-        )
+        SET status = s.code
+        FROM session_statuses s
+        WHERE s.id = sessions.status_id
     """)
-    
-    op.alter_column('sessions', 'status', nullable=False)
-    op.drop_constraint('fk_sessions_status', 'sessions', type_='foreignkey')
-    op.drop_column('sessions', 'status_id')
+
+    with op.batch_alter_table('sessions') as batch_op:
+        batch_op.alter_column('status', nullable=False)
+        batch_op.drop_constraint('fk_sessions_status', type_='foreignkey')
+        batch_op.drop_column('status_id')
     
     # Drop session_statuses table
     op.drop_table('session_statuses')
@@ -0,0 +1,47 @@
+"""add denormalized status_code to sessions
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+# pylint: disable=no-member,invalid-name
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add sessions.status_code mirroring session_statuses.code."""
+    op.add_column(
+        'sessions',
+        sa.Column(
+            'status_code', sa.String(50),
+            nullable=False, server_default='collecting',
+        ),
+    )
+    op.execute("""
+        UPDATE sessions
+        SET status_code = ss.code
+        FROM session_statuses ss
+        WHERE ss.id = sessions.status_id
+    """)
+    op.create_check_constraint(
+        'ck_sessions_status_code',
+        'sessions',
+        "status_code IN ('collecting', 'voting', 'rating', 'completed')",
+    )
+
+
+def downgrade() -> None:
+    """Remove sessions.status_code."""
+    op.drop_constraint('ck_sessions_status_code', 'sessions', type_='check')
+    op.drop_column('sessions', 'status_code')
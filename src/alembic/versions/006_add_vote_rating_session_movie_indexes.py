@@ -0,0 +1,56 @@
+"""add (session_id, movie_id) indexes on votes and ratings
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15 12:30:00.000000
+
+"""
+# pylint: disable=no-member,invalid-name
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_index_concurrently(name: str, definition: str) -> None:
+    """CREATE INDEX CONCURRENTLY ``name`` ON ``definition``, re-runnably.
+
+    A failed concurrent build leaves an INVALID index behind, which
+    ``IF NOT EXISTS`` would then silently keep.  Such a leftover is
+    dropped first so the re-run builds a usable index.  Must run inside
+    an autocommit block.
+    """
+    invalid = op.get_bind().execute(
+        sa.text(
+            "SELECT NOT indisvalid FROM pg_index "
+            "WHERE indexrelid = to_regclass(:name)"
+        ),
+        {"name": name},
+    ).scalar()
+    if invalid:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}")
+
+
+def upgrade() -> None:
+    """Create tally indexes without blocking writes."""
+    with op.get_context().autocommit_block():
+        _create_index_concurrently(
+            "ix_votes_session_movie", "votes (session_id, movie_id)",
+        )
+        _create_index_concurrently(
+            "ix_ratings_session_movie", "ratings (session_id, movie_id)",
+        )
+
+
+def downgrade() -> None:
+    """Drop tally indexes."""
+    op.drop_index('ix_ratings_session_movie', table_name='ratings')
+    op.drop_index('ix_votes_session_movie', table_name='votes')
@@ -0,0 +1,48 @@
+"""store poll movie-id mappings as integer arrays
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15 13:00:00.000000
+
+"""
+# pylint: disable=no-member,invalid-name
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = ('poll_slot1_movie_ids', 'poll_slot2_movie_ids')
+
+
+def upgrade() -> None:
+    """Convert JSON text like '[1, 2]' into INTEGER[]."""
+    for column in _COLUMNS:
+        op.alter_column(
+            'sessions',
+            column,
+            type_=postgresql.ARRAY(sa.Integer()),
+            existing_type=sa.Text(),
+            postgresql_using=(
+                f"string_to_array(btrim({column}, '[] '), ',')::integer[]"
+            ),
+        )
+
+
+def downgrade() -> None:
+    """Convert INTEGER[] back into JSON text."""
+    for column in _COLUMNS:
+        op.alter_column(
+            'sessions',
+            column,
+            type_=sa.Text(),
+            existing_type=postgresql.ARRAY(sa.Integer()),
+            postgresql_using=f"array_to_json({column})::text",
+        )
@@ -0,0 +1,43 @@
+"""fill created_at on the server side
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-15 13:30:00.000000
+
+"""
+# pylint: disable=no-member,invalid-name
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ('users', 'groups', 'admins', 'sessions', 'movies', 'votes', 'ratings')
+
+
+def upgrade() -> None:
+    """Default created_at to the current UTC time."""
+    for table in _TABLES:
+        op.alter_column(
+            table,
+            'created_at',
+            existing_type=sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())"),
+        )
+
+
+def downgrade() -> None:
+    """Remove created_at server defaults."""
+    for table in _TABLES:
+        op.alter_column(
+            table,
+            'created_at',
+            existing_type=sa.DateTime(),
+            server_default=None,
+        )
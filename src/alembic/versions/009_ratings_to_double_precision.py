@@ -0,0 +1,51 @@
+"""store movie ratings as double precision instead of numeric
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-15 14:00:00.000000
+
+"""
+# pylint: disable=no-member,invalid-name
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert kinopoisk_rating and club_rating to double precision."""
+    op.alter_column(
+        'movies', 'kinopoisk_rating',
+        type_=sa.Float(),
+        existing_type=sa.DECIMAL(3, 1),
+        postgresql_using='kinopoisk_rating::double precision',
+    )
+    op.alter_column(
+        'movies', 'club_rating',
+        type_=sa.Float(),
+        existing_type=sa.DECIMAL(4, 2),
+        postgresql_using='club_rating::double precision',
+    )
+
+
+def downgrade() -> None:
+    """Convert ratings back to fixed-precision numeric."""
+    op.alter_column(
+        'movies', 'club_rating',
+        type_=sa.DECIMAL(4, 2),
+        existing_type=sa.Float(),
+        postgresql_using='club_rating::numeric(4, 2)',
+    )
+    op.alter_column(
+        'movies', 'kinopoisk_rating',
+        type_=sa.DECIMAL(3, 1),
+        existing_type=sa.Float(),
+        postgresql_using='kinopoisk_rating::numeric(3, 1)',
+    )
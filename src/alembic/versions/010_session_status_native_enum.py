@@ -0,0 +1,61 @@
+"""store sessions.status_code as a native session_status enum
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-15 15:00:00.000000
+
+"""
+# pylint: disable=no-member,invalid-name
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+session_status = postgresql.ENUM(
+    'collecting', 'voting', 'rating', 'completed',
+    name='session_status',
+)
+
+
+def upgrade() -> None:
+    """Convert status_code from VARCHAR + CHECK to the session_status enum."""
+    session_status.create(op.get_bind())
+    op.drop_constraint('ck_sessions_status_code', 'sessions', type_='check')
+    # The varchar default cannot be cast implicitly; drop it around the change
+    op.alter_column('sessions', 'status_code', server_default=None)
+    op.alter_column(
+        'sessions', 'status_code',
+        type_=session_status,
+        existing_type=sa.String(50),
+        existing_nullable=False,
+        postgresql_using='status_code::session_status',
+    )
+    op.alter_column('sessions', 'status_code', server_default='collecting')
+
+
+def downgrade() -> None:
+    """Convert status_code back to VARCHAR with a CHECK constraint."""
+    op.alter_column('sessions', 'status_code', server_default=None)
+    op.alter_column(
+        'sessions', 'status_code',
+        type_=sa.String(50),
+        existing_type=session_status,
+        existing_nullable=False,
+        postgresql_using='status_code::text',
+    )
+    op.alter_column('sessions', 'status_code', server_default='collecting')
+    op.create_check_constraint(
+        'ck_sessions_status_code',
+        'sessions',
+        "status_code IN ('collecting', 'voting', 'rating', 'completed')",
+    )
+    session_status.drop(op.get_bind())
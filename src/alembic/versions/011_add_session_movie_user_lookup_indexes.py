@@ -0,0 +1,59 @@
+"""add lookup indexes for active sessions, session movies and usernames
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-15 15:30:00.000000
+
+"""
+# pylint: disable=no-member,invalid-name
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_index_concurrently(name: str, definition: str) -> None:
+    """CREATE INDEX CONCURRENTLY ``name`` ON ``definition``, re-runnably.
+
+    A failed concurrent build leaves an INVALID index behind, which
+    ``IF NOT EXISTS`` would then silently keep.  Such a leftover is
+    dropped first so the re-run builds a usable index.  Must run inside
+    an autocommit block.
+    """
+    invalid = op.get_bind().execute(
+        sa.text(
+            "SELECT NOT indisvalid FROM pg_index "
+            "WHERE indexrelid = to_regclass(:name)"
+        ),
+        {"name": name},
+    ).scalar()
+    if invalid:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}")
+
+
+def upgrade() -> None:
+    """Create lookup indexes without blocking writes."""
+    with op.get_context().autocommit_block():
+        _create_index_concurrently(
+            "ix_sessions_group_status_created",
+            "sessions (group_id, status_code, created_at DESC)",
+        )
+        _create_index_concurrently(
+            "ix_movies_session_slot", "movies (session_id, slot, id)",
+        )
+        _create_index_concurrently("ix_users_username", "users (username)")
+
+
+def downgrade() -> None:
+    """Drop lookup indexes."""
+    op.drop_index('ix_users_username', table_name='users')
+    op.drop_index('ix_movies_session_slot', table_name='movies')
+    op.drop_index('ix_sessions_group_status_created', table_name='sessions')
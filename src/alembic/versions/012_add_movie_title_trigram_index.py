@@ -0,0 +1,53 @@
+"""add pg_trgm GIN index on movies.title
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-15 16:00:00.000000
+
+"""
+# pylint: disable=no-member,invalid-name
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_index_concurrently(name: str, definition: str) -> None:
+    """CREATE INDEX CONCURRENTLY ``name`` ON ``definition``, re-runnably.
+
+    A failed concurrent build leaves an INVALID index behind, which
+    ``IF NOT EXISTS`` would then silently keep.  Such a leftover is
+    dropped first so the re-run builds a usable index.  Must run inside
+    an autocommit block.
+    """
+    invalid = op.get_bind().execute(
+        sa.text(
+            "SELECT NOT indisvalid FROM pg_index "
+            "WHERE indexrelid = to_regclass(:name)"
+        ),
+        {"name": name},
+    ).scalar()
+    if invalid:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}")
+
+
+def upgrade() -> None:
+    """Enable pg_trgm and index movie titles for substring search."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        _create_index_concurrently(
+            "ix_movies_title_trgm", "movies USING gin (title gin_trgm_ops)",
+        )
+
+
+def downgrade() -> None:
+    """Drop the title trigram index (the extension is left installed)."""
+    op.drop_index('ix_movies_title_trgm', table_name='movies')
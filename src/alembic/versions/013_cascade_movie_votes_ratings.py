@@ -0,0 +1,46 @@
+"""cascade movie deletes to votes and ratings
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-15 16:30:00.000000
+
+"""
+# pylint: disable=no-member,invalid-name
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _replace_movie_fk(table: str, on_delete: str) -> None:
+    """Recreate ``{table}.movie_id`` FK with the given ON DELETE action.
+
+    The new constraint is added NOT VALID and validated separately, so
+    the table is only briefly locked against writes.
+    """
+    constraint = f"{table}_movie_id_fkey"
+    op.execute(f"""
+        ALTER TABLE {table}
+            DROP CONSTRAINT {constraint},
+            ADD CONSTRAINT {constraint} FOREIGN KEY (movie_id)
+                REFERENCES movies (id) ON DELETE {on_delete} NOT VALID
+    """)
+    op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {constraint}")
+
+
+def upgrade() -> None:
+    """Delete a movie's votes and ratings together with the movie."""
+    _replace_movie_fk('votes', 'CASCADE')
+    _replace_movie_fk('ratings', 'CASCADE')
+
+
+def downgrade() -> None:
+    """Restore plain (NO ACTION) movie foreign keys."""
+    _replace_movie_fk('ratings', 'NO ACTION')
+    _replace_movie_fk('votes', 'NO ACTION')
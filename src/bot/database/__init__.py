@@ -1,15 +1,18 @@
 """Database package."""
-from bot.database.session import get_session, init_db
+from bot.database.session import get_session, init_db, prewarm_pool
 from bot.database.models import (
-    Base, User, Group, Admin, Session, SessionStatus, Movie, Vote, Rating
+    Base, User, Group, Admin, Session, SessionStatus, SessionStatusCode,
+    Movie, Vote, Rating,
 )
 from bot.database.status_manager import (
     get_status_by_code,
+    get_status_id,
     init_statuses,
     STATUS_COLLECTING,
     STATUS_VOTING,
     STATUS_RATING,
     STATUS_COMPLETED,
+    STATUS_NAMES,
 )
 from bot.database.repositories import (
     get_group_by_telegram_id,
@@ -22,11 +25,12 @@ from bot.database.repositories import (
 )
 
 __all__ = [
-    "get_session", "init_db",
+    "get_session", "init_db", "prewarm_pool",
     "Base", "User", "Group", "Admin", "Session", "SessionStatus",
-    "Movie", "Vote", "Rating",
-    "get_status_by_code", "init_statuses",
+    "SessionStatusCode", "Movie", "Vote", "Rating",
+    "get_status_by_code", "get_status_id", "init_statuses",
     "STATUS_COLLECTING", "STATUS_VOTING", "STATUS_RATING", "STATUS_COMPLETED",
+    "STATUS_NAMES",
     "get_group_by_telegram_id", "get_or_create_group",
     "get_or_create_user", "get_user_by_username",
     "get_active_session", "get_active_session_any",
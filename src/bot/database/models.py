@@ -1,14 +1,29 @@
 """Database models."""
+import enum
 from datetime import datetime
 from typing import List, Optional
 
 from sqlalchemy import (
     BigInteger, String, Integer, Text, DateTime, ForeignKey,
-    UniqueConstraint, DECIMAL
+    UniqueConstraint, Index, Float, Enum, DDL, event, text
 )
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
+# Server-side current time as naive UTC (like datetime.utcnow); used as the
+# created_at default and as a value for other timestamp assignments
+UTC_NOW = text("timezone('utc', now())")
+
+
+class SessionStatusCode(enum.StrEnum):
+    """Session status codes, stored as the native ``session_status`` enum."""
+    COLLECTING = "collecting"
+    VOTING = "voting"
+    RATING = "rating"
+    COMPLETED = "completed"
+
+
 class Base(DeclarativeBase):
     """Base class for all models."""
     pass
@@ -23,9 +38,6 @@ class SessionStatus(Base):
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(String(500))
 
-    # Relationships
-    sessions: Mapped[List["Session"]] = relationship("Session", back_populates="status_obj", lazy="selectin")
-
     def __repr__(self) -> str:
         return f"<SessionStatus(code={self.code}, name={self.name})>"
 
@@ -36,16 +48,16 @@ class User(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     telegram_id: Mapped[int] = mapped_column(BigInteger, unique=True, nullable=False)
-    username: Mapped[Optional[str]] = mapped_column(String(255))
+    username: Mapped[Optional[str]] = mapped_column(String(255), index=True)
     first_name: Mapped[Optional[str]] = mapped_column(String(255))
     last_name: Mapped[Optional[str]] = mapped_column(String(255))
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
 
     # Relationships
-    sessions: Mapped[List["Session"]] = relationship("Session", back_populates="creator", lazy="selectin")
-    movies: Mapped[List["Movie"]] = relationship("Movie", back_populates="proposer", lazy="selectin")
-    votes: Mapped[List["Vote"]] = relationship("Vote", back_populates="user", lazy="selectin")
-    ratings: Mapped[List["Rating"]] = relationship("Rating", back_populates="user", lazy="selectin")
+    sessions: Mapped[List["Session"]] = relationship("Session", back_populates="creator")
+    movies: Mapped[List["Movie"]] = relationship("Movie", back_populates="proposer")
+    votes: Mapped[List["Vote"]] = relationship("Vote", back_populates="user")
+    ratings: Mapped[List["Rating"]] = relationship("Rating", back_populates="user")
 
     def __repr__(self) -> str:
         return f"<User(id={self.id}, username={self.username})>"
@@ -58,10 +70,10 @@ class Group(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     telegram_id: Mapped[int] = mapped_column(BigInteger, unique=True, nullable=False)
     name: Mapped[Optional[str]] = mapped_column(String(255))
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
 
     # Relationships
-    sessions: Mapped[List["Session"]] = relationship("Session", back_populates="group", lazy="selectin")
+    sessions: Mapped[List["Session"]] = relationship("Session", back_populates="group")
 
     def __repr__(self) -> str:
         return f"<Group(id={self.id}, name={self.name})>"
@@ -74,7 +86,7 @@ class Admin(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     telegram_id: Mapped[int] = mapped_column(BigInteger, unique=True, nullable=False)
     username: Mapped[Optional[str]] = mapped_column(String(255))
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
 
     def __repr__(self) -> str:
         return f"<Admin(id={self.id}, username={self.username})>"
@@ -91,56 +103,73 @@ class Session(Base):
         ForeignKey("session_statuses.id"), 
         nullable=False
     )
+    # Denormalized copy of status_obj.code, kept in sync by set_status()
+    status: Mapped[SessionStatusCode] = mapped_column(
+        "status_code",
+        Enum(
+            SessionStatusCode,
+            name="session_status",
+            values_callable=lambda codes: [code.value for code in codes],
+        ),
+        nullable=False,
+        server_default=SessionStatusCode.COLLECTING.value,
+    )
     pinned_message_id: Mapped[Optional[int]] = mapped_column(BigInteger)
     poll_slot1_message_id: Mapped[Optional[int]] = mapped_column(BigInteger)
     poll_slot2_message_id: Mapped[Optional[int]] = mapped_column(BigInteger)
     poll_slot1_id: Mapped[Optional[str]] = mapped_column(String(255))
     poll_slot2_id: Mapped[Optional[str]] = mapped_column(String(255))
-    poll_slot1_movie_ids: Mapped[Optional[str]] = mapped_column(Text)
-    poll_slot2_movie_ids: Mapped[Optional[str]] = mapped_column(Text)
+    poll_slot1_movie_ids: Mapped[Optional[List[int]]] = mapped_column(ARRAY(Integer))
+    poll_slot2_movie_ids: Mapped[Optional[List[int]]] = mapped_column(ARRAY(Integer))
     winner_slot1_id: Mapped[Optional[int]] = mapped_column(ForeignKey("movies.id"))
     winner_slot2_id: Mapped[Optional[int]] = mapped_column(ForeignKey("movies.id"))
     rating_msg_slot1_id: Mapped[Optional[int]] = mapped_column(BigInteger)
     rating_msg_slot2_id: Mapped[Optional[int]] = mapped_column(BigInteger)
     rating_scoreboard_msg_id: Mapped[Optional[int]] = mapped_column(BigInteger)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
     voting_started_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
     completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
 
-    # Relationships
-    group: Mapped["Group"] = relationship("Group", back_populates="sessions", lazy="selectin")
-    creator: Mapped["User"] = relationship("User", back_populates="sessions", lazy="selectin")
-    status_obj: Mapped["SessionStatus"] = relationship("SessionStatus", back_populates="sessions", lazy="selectin")
+    # Relationships (lazy; load explicitly with selectinload() where needed)
+    group: Mapped["Group"] = relationship("Group", back_populates="sessions")
+    creator: Mapped["User"] = relationship("User", back_populates="sessions")
+    status_obj: Mapped["SessionStatus"] = relationship("SessionStatus")
     movies: Mapped[List["Movie"]] = relationship(
         "Movie",
         back_populates="session",
         foreign_keys="Movie.session_id",
-        lazy="selectin",
     )
-    votes: Mapped[List["Vote"]] = relationship("Vote", back_populates="session", lazy="selectin")
-    ratings: Mapped[List["Rating"]] = relationship("Rating", back_populates="session", lazy="selectin")
+    votes: Mapped[List["Vote"]] = relationship("Vote", back_populates="session")
+    ratings: Mapped[List["Rating"]] = relationship("Rating", back_populates="session")
     winner_slot1: Mapped[Optional["Movie"]] = relationship(
         "Movie",
         foreign_keys=[winner_slot1_id],
         post_update=True,
-        lazy="selectin",
     )
     winner_slot2: Mapped[Optional["Movie"]] = relationship(
         "Movie",
         foreign_keys=[winner_slot2_id],
         post_update=True,
-        lazy="selectin",
     )
 
-    @property
-    def status(self) -> str:
-        """Get status code for backward compatibility."""
-        return self.status_obj.code if self.status_obj else "unknown"
+    def set_status(self, code: str, status_id: int) -> None:
+        """Point the session at ``status_id`` and sync the denormalized code."""
+        self.status_id = status_id
+        self.status = SessionStatusCode(code)
 
     def __repr__(self) -> str:
         return f"<Session(id={self.id}, status={self.status})>"
 
 
+# Serves get_active_session*: group + status filter, newest first
+Index(
+    "ix_sessions_group_status_created",
+    Session.group_id,
+    Session.status,
+    Session.created_at.desc(),
+)
+
+
 class Movie(Base):
     """Movie model - proposed movies."""
     __tablename__ = "movies"
@@ -156,48 +185,71 @@ class Movie(Base):
     genres: Mapped[Optional[str]] = mapped_column(Text)  # JSON or CSV
     description: Mapped[Optional[str]] = mapped_column(Text)
     poster_url: Mapped[Optional[str]] = mapped_column(String(1000))
-    kinopoisk_rating: Mapped[Optional[float]] = mapped_column(DECIMAL(3, 1))
-    club_rating: Mapped[Optional[float]] = mapped_column(DECIMAL(4, 2))
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    kinopoisk_rating: Mapped[Optional[float]] = mapped_column(Float)
+    club_rating: Mapped[Optional[float]] = mapped_column(Float)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
 
     # Relationships
     session: Mapped["Session"] = relationship(
         "Session",
         back_populates="movies",
         foreign_keys=[session_id],
-        lazy="selectin",
     )
-    proposer: Mapped["User"] = relationship("User", back_populates="movies", lazy="selectin")
-    votes: Mapped[List["Vote"]] = relationship("Vote", back_populates="movie", lazy="selectin")
-    ratings: Mapped[List["Rating"]] = relationship("Rating", back_populates="movie", lazy="selectin")
+    proposer: Mapped["User"] = relationship("User", back_populates="movies")
+    # passive_deletes: the database cascades movie deletes to votes/ratings,
+    # so the ORM must not load them first
+    votes: Mapped[List["Vote"]] = relationship(
+        "Vote", back_populates="movie", passive_deletes=True,
+    )
+    ratings: Mapped[List["Rating"]] = relationship(
+        "Rating", back_populates="movie", passive_deletes=True,
+    )
 
     # Constraint: unique kinopoisk_id per session
     __table_args__ = (
         UniqueConstraint('session_id', 'kinopoisk_id', name='uq_session_kinopoisk'),
+        Index('ix_movies_session_slot', 'session_id', 'slot', 'id'),
+        # Trigram index so title ILIKE '%query%' avoids a seq scan
+        Index(
+            'ix_movies_title_trgm', 'title',
+            postgresql_using='gin',
+            postgresql_ops={'title': 'gin_trgm_ops'},
+        ),
     )
 
     def __repr__(self) -> str:
         return f"<Movie(id={self.id}, title={self.title}, year={self.year})>"
 
 
+# gin_trgm_ops needs the extension before create_all() builds the index
+event.listen(
+    Movie.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
+
+
 class Vote(Base):
     """Vote model - votes in polls."""
     __tablename__ = "votes"
 
     id: Mapped[int] = mapped_column(primary_key=True)
     session_id: Mapped[int] = mapped_column(ForeignKey("sessions.id"), nullable=False)
-    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id"), nullable=False)
+    movie_id: Mapped[int] = mapped_column(
+        ForeignKey("movies.id", ondelete="CASCADE"), nullable=False, index=True,
+    )
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
 
     # Relationships
-    session: Mapped["Session"] = relationship("Session", back_populates="votes", lazy="selectin")
-    movie: Mapped["Movie"] = relationship("Movie", back_populates="votes", lazy="selectin")
-    user: Mapped["User"] = relationship("User", back_populates="votes", lazy="selectin")
+    session: Mapped["Session"] = relationship("Session", back_populates="votes")
+    movie: Mapped["Movie"] = relationship("Movie", back_populates="votes")
+    user: Mapped["User"] = relationship("User", back_populates="votes")
 
     # Constraint: one vote per user per movie per session
     __table_args__ = (
         UniqueConstraint('session_id', 'movie_id', 'user_id', name='uq_session_movie_user_vote'),
+        Index('ix_votes_session_movie', 'session_id', 'movie_id'),
     )
 
     def __repr__(self) -> str:
@@ -210,19 +262,22 @@ class Rating(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     session_id: Mapped[int] = mapped_column(ForeignKey("sessions.id"), nullable=False)
-    movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id"), nullable=False)
+    movie_id: Mapped[int] = mapped_column(
+        ForeignKey("movies.id", ondelete="CASCADE"), nullable=False, index=True,
+    )
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     rating: Mapped[int] = mapped_column(Integer, nullable=False)  # 1-10
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
 
     # Relationships
-    session: Mapped["Session"] = relationship("Session", back_populates="ratings", lazy="selectin")
-    movie: Mapped["Movie"] = relationship("Movie", back_populates="ratings", lazy="selectin")
-    user: Mapped["User"] = relationship("User", back_populates="ratings", lazy="selectin")
+    session: Mapped["Session"] = relationship("Session", back_populates="ratings")
+    movie: Mapped["Movie"] = relationship("Movie", back_populates="ratings")
+    user: Mapped["User"] = relationship("User", back_populates="ratings")
 
     # Constraint: one rating per user per movie per session
     __table_args__ = (
         UniqueConstraint('session_id', 'movie_id', 'user_id', name='uq_session_movie_user_rating'),
+        Index('ix_ratings_session_movie', 'session_id', 'movie_id'),
     )
 
     def __repr__(self) -> str:
@@ -3,17 +3,18 @@
 All repeated database queries used by handlers should go through this
 module to avoid duplication and keep the handler layer thin.
 """
+import hashlib
 import logging
-import math
-from datetime import datetime
-from typing import Optional, List, Tuple
+import secrets
+from typing import Any, Dict, Iterable, Optional, List, Tuple
 
-from sqlalchemy import select, func, delete as sa_delete
+from sqlalchemy import Row, and_, select, func, update, lambda_stmt
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bot.config import config
-from bot.database.models import Group, User, Session, Movie, Rating, Vote
-from bot.database.status_manager import get_status_by_code, STATUS_COMPLETED
+from bot.database.models import Group, User, Session, Movie, Rating, UTC_NOW
+from bot.database.status_manager import get_status_id, STATUS_COMPLETED
 
 logger = logging.getLogger(__name__)
 
@@ -36,13 +37,38 @@ def resolve_telegram_group_id(
     return chat_id
 
 
+async def _insert_by_telegram_id(
+    db: AsyncSession, model, commit: bool = True, **values,
+):
+    """Insert a row keyed by ``telegram_id`` and return it, even on conflict.
+
+    ``ON CONFLICT DO UPDATE ... RETURNING`` yields the existing row when a
+    concurrent update created it first, so no follow-up SELECT or refresh
+    is needed. Pass ``commit=False`` to leave the insert in the caller's
+    transaction.
+    """
+    stmt = pg_insert(model).values(**values)
+    stmt = (
+        stmt.on_conflict_do_update(
+            index_elements=[model.telegram_id],
+            set_={"telegram_id": stmt.excluded.telegram_id},
+        )
+        .returning(model)
+        .execution_options(populate_existing=True)
+    )
+    row = (await db.execute(stmt)).scalar_one()
+    if commit:
+        await db.commit()
+    return row
+
+
 async def get_group_by_telegram_id(
     db: AsyncSession,
     telegram_id: int,
 ) -> Optional[Group]:
     """Get a group by its Telegram chat ID."""
     result = await db.execute(
-        select(Group).where(Group.telegram_id == telegram_id)
+        lambda_stmt(lambda: select(Group).where(Group.telegram_id == telegram_id))
     )
     return result.scalar_one_or_none()
 
@@ -55,14 +81,46 @@ async def get_or_create_group(
     """Get an existing group or create a new one."""
     group = await get_group_by_telegram_id(db, telegram_id)
     if not group:
-        group = Group(telegram_id=telegram_id, name=name)
-        db.add(group)
-        await db.commit()
-        await db.refresh(group)
+        group = await _insert_by_telegram_id(
+            db, Group, telegram_id=telegram_id, name=name,
+        )
         logger.info("Created new group: %d", telegram_id)
     return group
 
 
+async def get_or_create_groups(
+    db: AsyncSession,
+    telegram_ids: Iterable[int],
+) -> Dict[int, Group]:
+    """Get or create several groups at once, keyed by Telegram chat ID.
+
+    One IN query finds the existing rows; any missing groups are
+    inserted with a single multi-row upsert.
+    """
+    ids = set(telegram_ids)
+    if not ids:
+        return {}
+    result = await db.execute(select(Group).where(Group.telegram_id.in_(ids)))
+    groups = {group.telegram_id: group for group in result.scalars()}
+
+    missing = ids - groups.keys()
+    if missing:
+        stmt = pg_insert(Group).values([{"telegram_id": tid} for tid in missing])
+        stmt = (
+            stmt.on_conflict_do_update(
+                index_elements=[Group.telegram_id],
+                set_={"telegram_id": stmt.excluded.telegram_id},
+            )
+            .returning(Group)
+            .execution_options(populate_existing=True)
+        )
+        for group in (await db.execute(stmt)).scalars():
+            groups[group.telegram_id] = group
+        await db.commit()
+        logger.info("Created new groups: %s", sorted(missing))
+    return groups
+
+
 async def get_or_create_user(
     db: AsyncSession,
     telegram_id: int,
@@ -72,32 +130,74 @@ async def get_or_create_user(
 ) -> User:
     """Get an existing user or create a new one."""
     result = await db.execute(
-        select(User).where(User.telegram_id == telegram_id)
+        lambda_stmt(lambda: select(User).where(User.telegram_id == telegram_id))
     )
     user = result.scalar_one_or_none()
     if not user:
-        user = User(
+        user = await _insert_by_telegram_id(
+            db, User,
             telegram_id=telegram_id,
             username=username,
             first_name=first_name,
             last_name=last_name,
         )
-        db.add(user)
-        await db.commit()
-        await db.refresh(user)
         logger.info("Created new user: %d", telegram_id)
     return user
 
 
+async def get_users_by_ids(
+    db: AsyncSession,
+    user_ids: Iterable[int],
+) -> Dict[int, User]:
+    """Get users by internal ID in one IN query, keyed by ID."""
+    ids = set(user_ids)
+    if not ids:
+        return {}
+    result = await db.execute(select(User).where(User.id.in_(ids)))
+    return {user.id: user for user in result.scalars()}
+
+
+def _username_cache(db: AsyncSession) -> Dict[str, User]:
+    """Return the per-session username -> User cache kept in ``db.info``.
+
+    Only hits are cached, so users created later in the same session
+    are still found by the next lookup. The cache lives as long as the
+    session, so nothing leaks across requests.
+    """
+    return db.info.setdefault("user_by_username", {})
+
+
+async def get_users_by_usernames(
+    db: AsyncSession,
+    usernames: Iterable[str],
+) -> Dict[str, User]:
+    """Get users by Telegram username in one IN query, keyed by username."""
+    cache = _username_cache(db)
+    names = set(usernames)
+    found = {name: cache[name] for name in names if name in cache}
+    missing = names - found.keys()
+    if missing:
+        result = await db.execute(select(User).where(User.username.in_(missing)))
+        for user in result.scalars():
+            found[user.username] = cache[user.username] = user
+    return found
+
+
 async def get_user_by_username(
     db: AsyncSession,
     username: str,
 ) -> Optional[User]:
     """Get a user by their Telegram username."""
+    cache = _username_cache(db)
+    if username in cache:
+        return cache[username]
     result = await db.execute(
-        select(User).where(User.username == username)
+        lambda_stmt(lambda: select(User).where(User.username == username))
     )
-    return result.scalar_one_or_none()
+    user = result.scalar_one_or_none()
+    if user:
+        cache[username] = user
+    return user
 
 
 async def get_active_session(
@@ -113,18 +213,16 @@ async def get_active_session(
         status_code: Status code to filter by (e.g. STATUS_COLLECTING)
 
     Returns:
-        Session or None if not found or status not initialized
+        Session or None if not found
     """
-    status = await get_status_by_code(db, status_code)
-    if not status:
-        return None
     result = await db.execute(
         select(Session)
         .where(Session.group_id == group_id)
-        .where(Session.status_id == status.id)
+        .where(Session.status == status_code)
         .order_by(Session.created_at.desc())
+        .limit(1)
     )
-    return result.scalar_one_or_none()
+    return result.scalars().first()
 
 
 async def get_active_session_any(
@@ -135,70 +233,145 @@ async def get_active_session_any(
 
     Returns the most recent non-completed session, or None.
     """
-    completed_status = await get_status_by_code(db, STATUS_COMPLETED)
-    if not completed_status:
-        return None
     result = await db.execute(
         select(Session)
         .where(Session.group_id == group_id)
-        .where(Session.status_id != completed_status.id)
+        .where(Session.status != STATUS_COMPLETED)
         .order_by(Session.created_at.desc())
+        .limit(1)
     )
-    return result.scalar_one_or_none()
+    return result.scalars().first()
+
+
+async def get_group_active_session(
+    db: AsyncSession,
+    group_telegram_id: int,
+) -> Optional[Tuple[int, Optional[Session]]]:
+    """Resolve a group and its active session in one query.
+
+    Returns ``(group_id, session_or_None)``, or None if the group row
+    does not exist yet.
+    """
+    result = await db.execute(
+        select(Group.id, Session)
+        .outerjoin(
+            Session,
+            and_(
+                Session.group_id == Group.id,
+                Session.status != STATUS_COMPLETED,
+            ),
+        )
+        .where(Group.telegram_id == group_telegram_id)
+        .order_by(Session.created_at.desc().nulls_last())
+        .limit(1)
+    )
+    row = result.first()
+    return (row[0], row[1]) if row else None
 
 
 # ── Movie queries ────────────────────────────────────────────────────────
 
 
-async def get_movies_paginated(
+# Columns shown on an admin movie card; list views select only these
+_MOVIE_CARD_COLUMNS = (
+    Movie.id,
+    Movie.title,
+    Movie.year,
+    Movie.kinopoisk_rating,
+    Movie.club_rating,
+    Movie.session_id,
+    Movie.slot,
+)
+
+
+async def get_movies_paginated_lite(
     db: AsyncSession,
     page: int = 1,
     per_page: int = 5,
-) -> Tuple[List[Movie], int]:
-    """Get movies ordered by newest first with pagination.
+) -> Tuple[List[Row], int]:
+    """Get movie list rows ordered by newest first with pagination.
+
+    Selects only the columns a list card shows and returns plain rows
+    (attribute access like a Movie), skipping ORM hydration.
 
     Returns:
-        Tuple of (movies_list, total_pages).
+        Tuple of (movie_rows, total_pages).
     """
-    total = (await db.execute(select(func.count(Movie.id)))).scalar() or 0
-    total_pages = max(1, math.ceil(total / per_page))
     offset = (page - 1) * per_page
 
+    # count(*) OVER () returns the total alongside the page rows
     result = await db.execute(
-        select(Movie)
-        .order_by(Movie.created_at.desc())
+        select(*_MOVIE_CARD_COLUMNS, func.count().over().label("total"))
+        .order_by(Movie.created_at.desc(), Movie.id.desc())
         .offset(offset)
         .limit(per_page)
     )
-    return list(result.scalars().all()), total_pages
+    rows = result.all()
+    if rows:
+        total = rows[0].total
+    else:
+        # Page past the end: the window yields no rows to read the total from
+        total = (await db.execute(select(func.count(Movie.id)))).scalar() or 0
+
+    total_pages = max(1, -(-total // per_page))
+    return rows, total_pages
 
 
 async def search_movies_by_title(
     db: AsyncSession,
     query: str,
     limit: int = 10,
-) -> List[Movie]:
-    """Search movies by title (case-insensitive LIKE)."""
+) -> List[Row]:
+    """Search movies by title (case-insensitive LIKE).
+
+    Returns movie card rows (see get_movies_paginated_lite), not Movie objects.
+    """
     result = await db.execute(
-        select(Movie)
+        select(*_MOVIE_CARD_COLUMNS)
         .where(Movie.title.ilike(f"%{query}%"))
-        .order_by(Movie.created_at.desc())
+        .order_by(Movie.created_at.desc(), Movie.id.desc())
         .limit(limit)
     )
-    return list(result.scalars().all())
+    return list(result.all())
 
 
 async def get_movie_by_id(
     db: AsyncSession,
     movie_id: int,
 ) -> Optional[Movie]:
-    """Get a movie by its primary key."""
-    result = await db.execute(select(Movie).where(Movie.id == movie_id))
-    return result.scalar_one_or_none()
+    """Get a movie by its primary key (identity map first)."""
+    return await db.get(Movie, movie_id)
+
+
+async def get_winner_movies(
+    db: AsyncSession,
+    session: Session,
+) -> List[Movie]:
+    """Return winner movies for the session in one query, sorted by slot."""
+    winner_ids = [
+        wid
+        for wid in (session.winner_slot1_id, session.winner_slot2_id)
+        if wid is not None
+    ]
+    if not winner_ids:
+        return []
+
+    result = await db.execute(
+        select(Movie).where(Movie.id.in_(winner_ids)).order_by(Movie.slot)
+    )
+    return list(result.scalars())
+
+
+async def get_movie_card(db: AsyncSession, movie_id: int) -> Optional[Row]:
+    """Get a movie's card columns as a Row, for read-only display."""
+    result = await db.execute(
+        select(*_MOVIE_CARD_COLUMNS).where(Movie.id == movie_id)
+    )
+    return result.first()
 
 
 async def delete_movie_by_id(db: AsyncSession, movie_id: int) -> bool:
-    """Delete a movie and its related votes/ratings.
+    """Delete a movie; its votes/ratings go with it via ON DELETE CASCADE.
 
     Also clears winner references in the parent session.
     Returns True if the movie was found and deleted.
@@ -207,67 +380,165 @@ async def delete_movie_by_id(db: AsyncSession, movie_id: int) -> bool:
     if not movie:
         return False
 
-    session = movie.session
-
-    # Clear winner references if this movie was a winner
-    if session.winner_slot1_id == movie_id:
-        session.winner_slot1_id = None
-    if session.winner_slot2_id == movie_id:
-        session.winner_slot2_id = None
+    # Clear winner references in one statement; NULLIF leaves other ids as-is
+    await db.execute(
+        update(Session)
+        .where(Session.id == movie.session_id)
+        .values(
+            winner_slot1_id=func.nullif(Session.winner_slot1_id, movie_id),
+            winner_slot2_id=func.nullif(Session.winner_slot2_id, movie_id),
+        )
+    )
 
-    # Delete related records
-    await db.execute(sa_delete(Rating).where(Rating.movie_id == movie_id))
-    await db.execute(sa_delete(Vote).where(Vote.movie_id == movie_id))
     await db.delete(movie)
     await db.commit()
     return True
 
 
-async def get_movie_avg_rating(db: AsyncSession, movie_id: int) -> float:
-    """Get average rating for a movie from Rating records."""
-    result = await db.execute(
-        select(func.avg(Rating.rating)).where(Rating.movie_id == movie_id)
-    )
-    avg = result.scalar()
-    return round(float(avg), 2) if avg else 0.0
-
-
 async def recalc_club_rating(db: AsyncSession, movie_id: int) -> Optional[float]:
     """Recalculate and store club_rating from Rating records.
 
     Returns the new average, or None if there are no ratings.
     """
+    avg_subquery = (
+        select(func.round(func.avg(Rating.rating), 2))
+        .where(Rating.movie_id == movie_id)
+        .scalar_subquery()
+    )
     result = await db.execute(
-        select(func.avg(Rating.rating)).where(Rating.movie_id == movie_id)
+        update(Movie)
+        .where(Movie.id == movie_id)
+        .values(club_rating=avg_subquery)
+        .returning(Movie.club_rating)
+        # The new value comes back via RETURNING; skip the identity-map
+        # sync, which cannot evaluate the subquery in Python anyway
+        .execution_options(synchronize_session=False)
     )
     avg = result.scalar()
-
-    movie = await get_movie_by_id(db, movie_id)
-    if movie:
-        movie.club_rating = round(float(avg), 2) if avg else None
-        await db.commit()
-
-    return round(float(avg), 2) if avg else None
+    await db.commit()
+    return avg
 
 
 async def _get_or_create_system_user(db: AsyncSession) -> User:
-    """Get or create the primary system placeholder user (telegram_id = -1)."""
+    """Get or create the primary system placeholder user (telegram_id = -1).
+
+    Does not commit: callers add rows that reference the user and commit
+    the whole unit of work once.
+    """
     result = await db.execute(
         select(User).where(User.telegram_id == -1)
     )
     user = result.scalar_one_or_none()
     if not user:
-        user = User(
-            telegram_id=-1,
-            username="system",
-            first_name="System",
+        user = await _insert_by_telegram_id(
+            db, User, commit=False,
+            telegram_id=-1, username="system", first_name="System",
         )
-        db.add(user)
-        await db.commit()
-        await db.refresh(user)
     return user
 
 
+async def copy_movie_ratings(
+    db: AsyncSession,
+    movie_id: int,
+    ratings: List[Tuple[int, int]],
+) -> int:
+    """Bulk-load (user_id, rating) pairs for a movie with PostgreSQL COPY.
+
+    Runs on the session's own connection, so it joins the current
+    transaction. Returns 0 without loading anything if the movie does
+    not exist. Does not commit.
+    """
+    result = await db.execute(
+        select(Movie.session_id).where(Movie.id == movie_id)
+    )
+    session_id = result.scalar_one_or_none()
+    if session_id is None:
+        return 0
+
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        Rating.__tablename__,
+        records=[
+            (session_id, movie_id, user_id, rating)
+            for user_id, rating in ratings
+        ],
+        columns=["session_id", "movie_id", "user_id", "rating"],
+    )
+    return len(ratings)
+
+
+def _placeholder_telegram_id(name: str) -> int:
+    """Derive a stable negative Telegram ID for a named placeholder user.
+
+    Real Telegram IDs are positive and -1 is the system user, so
+    placeholders hash into the range below -1. A stable ID lets the
+    unique ``telegram_id`` constraint deduplicate them across imports.
+    """
+    digest = hashlib.blake2b(name.encode(), digest_size=6).digest()
+    return -2 - int.from_bytes(digest, "big")
+
+
+def _anonymous_telegram_id() -> int:
+    """Return a fresh random negative Telegram ID for an anonymous rater."""
+    return -2 - secrets.randbits(48)
+
+
+async def get_or_create_placeholder_users(
+    db: AsyncSession,
+    names: Iterable[str],
+) -> Dict[str, int]:
+    """Upsert placeholder users in one statement, keyed name -> user id.
+
+    Used for ratings entered by an admin on behalf of people who never
+    talked to the bot. Does not commit.
+    """
+    rows = [
+        {
+            "telegram_id": _placeholder_telegram_id(name),
+            "username": name,
+            "first_name": name,
+        }
+        for name in set(names)
+    ]
+    if not rows:
+        return {}
+    stmt = pg_insert(User).values(rows)
+    # DO UPDATE (not DO NOTHING) so RETURNING yields existing rows too
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[User.telegram_id],
+        set_={"telegram_id": stmt.excluded.telegram_id},
+    ).returning(User.id, User.username)
+    result = await db.execute(stmt)
+    return {row.username: row.id for row in result}
+
+
+async def create_anonymous_users(
+    db: AsyncSession,
+    names: List[str],
+) -> List[int]:
+    """Insert one new placeholder user per entry of *names* in one statement.
+
+    For ratings entered without a username: display names like "User0"
+    repeat between batches, so each entry gets its own user with a
+    random ID instead of a name-derived one. Returns user ids aligned
+    with *names*. Does not commit.
+    """
+    if not names:
+        return []
+    telegram_ids = [_anonymous_telegram_id() for _ in names]
+    result = await db.execute(
+        pg_insert(User)
+        .values([
+            {"telegram_id": tid, "username": name, "first_name": name}
+            for tid, name in zip(telegram_ids, names)
+        ])
+        .returning(User.telegram_id, User.id)
+    )
+    ids_by_tid = dict(result.all())
+    return [ids_by_tid[tid] for tid in telegram_ids]
+
+
 # ── Session management ───────────────────────────────────────────────────
 
 
@@ -277,12 +548,12 @@ async def set_session_status(
     status_code: str,
 ) -> bool:
     """Change session status. Returns False if target status not found."""
-    new_status = await get_status_by_code(db, status_code)
-    if not new_status:
+    status_id = await get_status_id(db, status_code)
+    if status_id is None:
         return False
-    session.status_id = new_status.id
+    session.set_status(status_code, status_id)
     if status_code == STATUS_COMPLETED:
-        session.completed_at = datetime.utcnow()
+        session.completed_at = UTC_NOW
     await db.commit()
     return True
 
@@ -292,30 +563,77 @@ async def get_session_movies(
     session_id: int,
 ) -> List[Movie]:
     """Get all movies for a session ordered by slot."""
+    result = await db.execute(lambda_stmt(
+        lambda: select(Movie)
+        .where(Movie.session_id == session_id)
+        .order_by(Movie.slot, Movie.id)
+    ))
+    return list(result.scalars().all())
+
+
+async def get_session_movies_lite(
+    db: AsyncSession,
+    session_id: int,
+) -> List[Row]:
+    """Get a session's movies as card-column Rows ordered by slot.
+
+    For read-only listings: skips descriptions and other wide columns
+    and the ORM identity-map bookkeeping of full Movie entities.
+    """
     result = await db.execute(
-        select(Movie)
+        select(*_MOVIE_CARD_COLUMNS)
         .where(Movie.session_id == session_id)
         .order_by(Movie.slot, Movie.id)
     )
-    return list(result.scalars().all())
+    return list(result.all())
 
 
-async def create_completed_session_for_import(
+async def import_completed_movies(
     db: AsyncSession,
     group_id: int,
     created_by_id: int,
-) -> Session:
-    """Create a completed session for batch import."""
-    completed_status = await get_status_by_code(db, STATUS_COMPLETED)
-    now = datetime.utcnow()
-    session = Session(
-        group_id=group_id,
-        created_by=created_by_id,
-        status_id=completed_status.id,
-        created_at=now,
-        completed_at=now,
+    movies: List[Dict[str, Any]],
+) -> int:
+    """Import movies, each as the slot 1 winner of its own completed session.
+
+    *movies* are Movie column values without ``session_id``/``user_id``/
+    ``slot``.  Runs three statements whatever the batch size: sessions
+    and movies are multi-row INSERT ... RETURNING, then winners are set
+    with one executemany UPDATE.  Does not commit.  Returns the number
+    of imported movies.
+    """
+    if not movies:
+        return 0
+
+    completed_status_id = await get_status_id(db, STATUS_COMPLETED)
+    # The sessions are identical, so RETURNING order does not matter.
+    # created_at comes from its server default; now() is fixed per
+    # transaction, so both timestamps match
+    session_ids = list(await db.scalars(
+        pg_insert(Session)
+        .values([
+            {
+                "group_id": group_id,
+                "created_by": created_by_id,
+                "status_id": completed_status_id,
+                "status": STATUS_COMPLETED,
+                "completed_at": UTC_NOW,
+            }
+            for _ in movies
+        ])
+        .returning(Session.id)
+    ))
+    result = await db.execute(
+        pg_insert(Movie)
+        .values([
+            {**md, "session_id": sid, "user_id": created_by_id, "slot": 1}
+            for md, sid in zip(movies, session_ids)
+        ])
+        .returning(Movie.session_id, Movie.id)
     )
-    db.add(session)
-    await db.commit()
-    await db.refresh(session)
-    return session
+    winners = result.all()
+    await db.execute(
+        update(Session),
+        [{"id": sid, "winner_slot1_id": mid} for sid, mid in winners],
+    )
+    return len(winners)
@@ -1,16 +1,52 @@
 """Session status manager."""
-from typing import Optional
-from sqlalchemy import select
+from typing import Dict, Optional
+from sqlalchemy import select, lambda_stmt
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from bot.database.models import SessionStatus
+from bot.database.models import SessionStatus, SessionStatusCode
 
 
 # Status codes
-STATUS_COLLECTING = "collecting"
-STATUS_VOTING = "voting"
-STATUS_RATING = "rating"
-STATUS_COMPLETED = "completed"
+STATUS_COLLECTING = SessionStatusCode.COLLECTING
+STATUS_VOTING = SessionStatusCode.VOTING
+STATUS_RATING = SessionStatusCode.RATING
+STATUS_COMPLETED = SessionStatusCode.COMPLETED
+
+# Human-readable status names (mirror session_statuses.name)
+STATUS_NAMES = {
+    STATUS_COLLECTING: "Сбор предложений",
+    STATUS_VOTING: "Голосование",
+    STATUS_RATING: "Выставление рейтингов",
+    STATUS_COMPLETED: "Завершена",
+}
+
+# code -> session_statuses.id; the rows are seeded once and never change
+_STATUS_ID_CACHE: Dict[str, int] = {}
+
+# Seed rows for session_statuses
+DEFAULT_STATUSES = [
+    {
+        "code": STATUS_COLLECTING,
+        "name": STATUS_NAMES[STATUS_COLLECTING],
+        "description": "Участники предлагают фильмы для голосования"
+    },
+    {
+        "code": STATUS_VOTING,
+        "name": STATUS_NAMES[STATUS_VOTING],
+        "description": "Идет голосование за предложенные фильмы"
+    },
+    {
+        "code": STATUS_RATING,
+        "name": STATUS_NAMES[STATUS_RATING],
+        "description": "Участники оценивают просмотренные фильмы"
+    },
+    {
+        "code": STATUS_COMPLETED,
+        "name": STATUS_NAMES[STATUS_COMPLETED],
+        "description": "Сессия завершена"
+    }
+]
 
 
 async def get_status_by_code(db: AsyncSession, code: str) -> Optional[SessionStatus]:
@@ -23,10 +59,37 @@ async def get_status_by_code(db: AsyncSession, code: str) -> Optional[SessionSta
     Returns:
         SessionStatus object or None
     """
+    status_id = _STATUS_ID_CACHE.get(code)
+    if status_id is not None:
+        return await db.get(SessionStatus, status_id)
     result = await db.execute(
-        select(SessionStatus).where(SessionStatus.code == code)
+        lambda_stmt(lambda: select(SessionStatus).where(SessionStatus.code == code))
     )
-    return result.scalar_one_or_none()
+    status = result.scalar_one_or_none()
+    if status:
+        _STATUS_ID_CACHE[code] = status.id
+    return status
+
+
+async def get_status_id(db: AsyncSession, code: str) -> Optional[int]:
+    """Get session status ID by code, cached for the process lifetime.
+
+    Args:
+        db: Database session
+        code: Status code
+
+    Returns:
+        Status ID or None if the status is not initialized
+    """
+    status_id = _STATUS_ID_CACHE.get(code)
+    if status_id is None:
+        result = await db.execute(
+            select(SessionStatus.id).where(SessionStatus.code == code)
+        )
+        status_id = result.scalar_one_or_none()
+        if status_id is not None:
+            _STATUS_ID_CACHE[code] = status_id
+    return status_id
 
 
 async def init_statuses(db: AsyncSession) -> None:
@@ -35,38 +98,12 @@ async def init_statuses(db: AsyncSession) -> None:
     Args:
         db: Database session
     """
-    statuses = [
-        {
-            "code": STATUS_COLLECTING,
-            "name": "Сбор предложений",
-            "description": "Участники предлагают фильмы для голосования"
-        },
-        {
-            "code": STATUS_VOTING,
-            "name": "Голосование",
-            "description": "Идет голосование за предложенные фильмы"
-        },
-        {
-            "code": STATUS_RATING,
-            "name": "Выставление рейтингов",
-            "description": "Участники оценивают просмотренные фильмы"
-        },
-        {
-            "code": STATUS_COMPLETED,
-            "name": "Завершена",
-            "description": "Сессия завершена"
-        }
-    ]
-    
-    for status_data in statuses:
-        # Check if status exists
-        existing = await get_status_by_code(db, status_data["code"])
-        if not existing:
-            status = SessionStatus(
-                code=status_data["code"],
-                name=status_data["name"],
-                description=status_data["description"]
-            )
-            db.add(status)
-    
+    await db.execute(
+        pg_insert(SessionStatus)
+        .values(DEFAULT_STATUSES)
+        .on_conflict_do_nothing(index_elements=[SessionStatus.code])
+    )
     await db.commit()
+
+    result = await db.execute(select(SessionStatus.code, SessionStatus.id))
+    _STATUS_ID_CACHE.update(result.tuples().all())
@@ -3,9 +3,12 @@
 Centralizes repeated formatting patterns to avoid duplication
 across handler modules.
 """
+from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 
+@lru_cache(maxsize=512)
 def format_year_suffix(year: Optional[int]) -> str:
     """Return ' (YEAR)' if year is set, otherwise empty string.
 
@@ -26,13 +29,28 @@ def format_user_display_name(
     Example: format_user_display_name("john") -> '@john'
     """
     if username:
-        return f"@{username}"
+        return "@" + username
     return first_name or fallback
 
 
+@lru_cache(maxsize=2048)
 def format_movie_title(title: str, year: Optional[int] = None) -> str:
     """Format movie title with optional year.
 
     Example: format_movie_title("Matrix", 1999) -> 'Matrix (1999)'
     """
     return f"{title}{format_year_suffix(year)}"
+
+
+def format_datetime(value: datetime) -> str:
+    """Format a timestamp as 'DD.MM.YYYY HH:MM'.
+
+    Builds the string from fields directly instead of going through
+    strftime's format parser.
+
+    Example: format_datetime(datetime(2024, 3, 7, 9, 5)) -> '07.03.2024 09:05'
+    """
+    return (
+        f"{value.day:02d}.{value.month:02d}.{value.year} "
+        f"{value.hour:02d}:{value.minute:02d}"
+    )
@@ -3,8 +3,11 @@
 Entry point: /admin command opens a reply-keyboard admin panel.
 Navigation: reply-keyboard sub-menus with a ↩️ Назад button.
 """
+import asyncio
+import html as html_lib
 import logging
 import re
+import time
 from typing import List, Optional, Tuple
 
 from aiogram import Router, F
@@ -12,22 +15,35 @@ from aiogram.filters import Command
 from aiogram.types import Message, CallbackQuery
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
-from sqlalchemy import func, select
+from sqlalchemy import (
+    BigInteger, Integer, Row, case, cast, column, func, insert, select, table,
+    values,
+)
+from sqlalchemy.dialects.postgresql import REGCLASS
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from bot.config import config
 from bot.database.models import Session, Group, Movie, Rating, User
-from bot.database.session import AsyncSessionLocal
 from bot.database.repositories import (
     get_or_create_group,
+    get_or_create_groups,
     get_active_session_any,
-    get_movies_paginated,
+    get_group_active_session,
+    get_movies_paginated_lite,
     search_movies_by_title,
     get_movie_by_id,
+    get_movie_card,
     delete_movie_by_id,
     recalc_club_rating,
     set_session_status,
     get_session_movies,
-    create_completed_session_for_import,
+    get_session_movies_lite,
+    get_winner_movies,
+    get_users_by_usernames,
+    get_or_create_placeholder_users,
+    create_anonymous_users,
+    copy_movie_ratings,
+    import_completed_movies,
     _get_or_create_system_user,
 )
 from bot.database.status_manager import (
@@ -35,8 +51,9 @@ from bot.database.status_manager import (
     STATUS_VOTING,
     STATUS_RATING,
     STATUS_COMPLETED,
+    STATUS_NAMES,
 )
-from bot.formatters import format_year_suffix
+from bot.formatters import format_datetime, format_year_suffix
 from bot.services.kinopoisk import (
     parse_movie_data,
     format_movie_info,
@@ -73,19 +90,111 @@ from bot.keyboards import (
     get_admin_movie_actions_keyboard,
     get_admin_movie_list_pagination,
     get_admin_delete_confirm_keyboard,
+    ConfirmCallback,
     get_confirmation_keyboard,
     get_main_menu_keyboard,
     get_admin_group_selector_keyboard,
 )
-from bot.utils import try_delete_message, replace_bot_message, abort_flow, finish_flow
+from bot.utils import (
+    try_delete_message, delete_bot_message, replace_bot_message, swap_ui,
+    abort_flow, finish_flow,
+)
 from bot.log_handler import get_recent_logs
 
 logger = logging.getLogger(__name__)
 
 router = Router()
 
+# The admin panel lives in private chats only. One router-level check
+# keeps group traffic from being tested against every admin filter.
+router.message.filter(F.chat.type == "private")
+router.callback_query.filter(F.message.chat.type == "private")
+
 MOVIES_PER_PAGE = 5
 
+_ADMIN_PANEL_TEXT = "👑 <b>Админ-панель</b>\n\nВыберите раздел:"
+_MOVIES_MENU_TEXT = "🎬 <b>Фильмы</b>\n\nВыберите действие:"
+_NO_SESSION_TEXT = "📋 <b>Сессии</b>\n\nНет активной сессии."
+
+_BATCH_IMPORT_YES = ConfirmCallback.filter(
+    (F.action == "batch_import") & (F.decision == "yes")
+)
+_BATCH_IMPORT_NO = ConfirmCallback.filter(
+    (F.action == "batch_import") & (F.decision == "no")
+)
+
+# Tables above this many rows use the planner estimate instead of COUNT(*)
+_DB_STATS_EXACT_LIMIT = 10_000
+
+_PG_CLASS = table("pg_class", column("oid"), column("reltuples"))
+
+
+def _estimated_row_count(model):
+    """Row count of *model*'s table, estimated from pg_class when large.
+
+    Returns two columns: the count, labelled by table name, and
+    ``<table>_estimated``, true when the count is the planner estimate.
+    ``reltuples`` is -1 for tables that were never analyzed and coarse
+    for small ones, so those still get an exact COUNT(*).  PostgreSQL
+    evaluates the count subquery only when the CASE branch needs it.
+    """
+    name = model.__tablename__
+    estimate = (
+        select(_PG_CLASS.c.reltuples)
+        .where(_PG_CLASS.c.oid == cast(name, REGCLASS))
+        .scalar_subquery()
+    )
+    is_estimate = estimate >= _DB_STATS_EXACT_LIMIT
+    return (
+        case(
+            (is_estimate, cast(estimate, BigInteger)),
+            else_=select(func.count()).select_from(model).scalar_subquery(),
+        ).label(name),
+        func.coalesce(is_estimate, False).label(f"{name}_estimated"),
+    )
+
+
+# DB stats screen lines, in display order
+_DB_STATS_TABLES = (
+    ("👥 Пользователей", User),
+    ("🏢 Групп", Group),
+    ("📅 Сессий", Session),
+    ("🎬 Фильмов", Movie),
+    ("⭐ Рейтингов", Rating),
+)
+
+# Row counts for the DB stats screen as one statement, labelled by table
+_DB_STATS_QUERY = select(*(
+    column_
+    for _, model in _DB_STATS_TABLES
+    for column_ in _estimated_row_count(model)
+))
+
+# Kinopoisk requests kept in flight at once during batch import
+_BATCH_FETCH_CONCURRENCY = 8
+
+# Minimum seconds between batch import progress edits (Telegram rate limits)
+_BATCH_PROGRESS_INTERVAL = 2.0
+
+# Rating batches larger than this are loaded with COPY instead of INSERT
+_COPY_RATINGS_THRESHOLD = 100
+
+# Inline commands from admin movie lists: "<prefix><movie id>"
+_DEL_MOVIE_CMD = "/del_movie_"
+_SET_WINNER_CMD = "/set_winner_"
+_ADD_RATING_CMD = "/add_rating_"
+
+# One movie per line: "<kinopoisk url> <club rating>", "," or "." decimals
+_BATCH_LINE_RE = re.compile(
+    r"^[ \t]*((?=\S).*?kinopoisk.*?)[ \t]+(\d+(?:[.,]\d*)?)[ \t\r]*$",
+    re.MULTILINE | re.IGNORECASE,
+)
+
+# One rating per line: "[@username] <rating>"
+_RATING_LINE_RE = re.compile(
+    r"^[ \t]*(?:@?(\S+?)[ \t]+)?(\d{1,2})\s*?$", re.MULTILINE,
+)
+
 
 # ── FSM States ───────────────────────────────────────────────────────────
 
@@ -138,11 +247,10 @@ class AdminBatchImportState(StatesGroup):
 
 
 @router.message(Command("admin"))
-async def cmd_admin(message: Message, state: FSMContext) -> None:
-    """Open admin panel (private chat only)."""
-    if message.chat.type != "private":
-        return
-
+async def cmd_admin(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
+    """Open admin panel (private chat only, see the router filter)."""
     await state.clear()
     await try_delete_message(message)
 
@@ -150,30 +258,42 @@ async def cmd_admin(message: Message, state: FSMContext) -> None:
         await state.update_data(admin_group_id=config.GROUP_IDS[0])
         await state.set_state(AdminMenuState.main_menu)
         bot_msg = await message.answer(
-            "👑 <b>Админ-панель</b>\n\n"
-            "Выберите раздел:",
+            _ADMIN_PANEL_TEXT,
             reply_markup=get_admin_menu_keyboard(),
         )
         await state.update_data(bot_message_id=bot_msg.message_id)
     else:
-        await _show_group_selector(message, state)
-
-
-async def _get_admin_group_id(state: FSMContext) -> Optional[int]:
-    """Extract admin_group_id from FSM data."""
-    data = await state.get_data()
-    return data.get("admin_group_id")
+        await _show_group_selector(message, state, db)
 
 
-async def _show_group_selector(message: Message, state: FSMContext) -> None:
+async def _get_admin_group_db_id(
+    db: AsyncSession, state: FSMContext, data: Optional[dict] = None,
+) -> int:
+    """Get the internal id of the selected admin group.
+
+    Cached in FSM data as ``admin_group_db_id`` after the first lookup,
+    so later admin actions skip the group SELECT.  Pass *data* when the
+    caller has already read the FSM data.
+    """
+    if data is None:
+        data = await state.get_data()
+    group_db_id = data.get("admin_group_db_id")
+    if group_db_id is None:
+        group = await get_or_create_group(db, data.get("admin_group_id"))
+        group_db_id = group.id
+        await state.update_data(admin_group_db_id=group_db_id)
+    return group_db_id
+
+
+async def _show_group_selector(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
     """Show inline keyboard for group selection."""
     await state.set_state(AdminMenuState.select_group)
-    groups: List[Tuple[int, str]] = []
-    async with AsyncSessionLocal() as db:
-        for gid in config.GROUP_IDS:
-            group = await get_or_create_group(db, gid)
-            name = group.name or str(gid)
-            groups.append((gid, name))
+    by_tid = await get_or_create_groups(db, config.GROUP_IDS)
+    groups = tuple(
+        (gid, by_tid[gid].name or str(gid)) for gid in config.GROUP_IDS
+    )
 
     bot_msg = await message.answer(
         "👑 <b>Админ-панель</b>\n\n"
@@ -186,31 +306,35 @@ async def _show_group_selector(message: Message, state: FSMContext) -> None:
 @router.callback_query(F.data.startswith("adm_group:"))
 async def admin_select_group(callback: CallbackQuery, state: FSMContext) -> None:
     """Handle group selection from inline keyboard."""
-    group_tid = int(callback.data.split(":")[1])
     await callback.answer()
-    await state.update_data(admin_group_id=group_tid)
+    group_tid = int(callback.data.split(":")[1])
+    # Drop the cached ids of the previously selected group
+    await state.update_data(
+        admin_group_id=group_tid, admin_group_db_id=None, admin_session_id=None,
+    )
     await state.set_state(AdminMenuState.main_menu)
 
     try:
         await callback.message.edit_text(
-            "👑 <b>Админ-панель</b>\n\n"
-            "Выберите раздел:",
+            _ADMIN_PANEL_TEXT,
         )
     except Exception:
         pass
 
     bot_msg = await callback.message.answer(
-        "👑 <b>Админ-панель</b>\n\nВыберите раздел:",
+        _ADMIN_PANEL_TEXT,
         reply_markup=get_admin_menu_keyboard(),
     )
     await state.update_data(bot_message_id=bot_msg.message_id)
 
 
 @router.message(F.text == BTN_ADM_CHANGE_GROUP)
-async def admin_change_group(message: Message, state: FSMContext) -> None:
+async def admin_change_group(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
     """Switch to a different group."""
     await try_delete_message(message)
-    await _show_group_selector(message, state)
+    await _show_group_selector(message, state, db)
 
 
 # ══════════════════════════════════════════════════════════════════════════
@@ -232,11 +356,10 @@ async def admin_exit(message: Message, state: FSMContext) -> None:
 @router.message(F.text == BTN_BACK)
 async def admin_back(message: Message, state: FSMContext) -> None:
     """Go back to admin main menu from any sub-menu."""
-    await try_delete_message(message)
     await state.set_state(AdminMenuState.main_menu)
-    await replace_bot_message(
+    await swap_ui(
         message, state,
-        "👑 <b>Админ-панель</b>\n\nВыберите раздел:",
+        _ADMIN_PANEL_TEXT,
         reply_markup=get_admin_menu_keyboard(),
     )
 
@@ -247,76 +370,77 @@ async def admin_back(message: Message, state: FSMContext) -> None:
 
 
 @router.message(F.text == BTN_ADMIN_SESSIONS)
-async def admin_sessions(message: Message, state: FSMContext) -> None:
+async def admin_sessions(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
     """Show sessions sub-menu with context-sensitive actions."""
     await try_delete_message(message)
     await state.set_state(AdminMenuState.sessions_menu)
 
-    async with AsyncSessionLocal() as db:
-        group_tid = await _get_admin_group_id(state)
-        group = await get_or_create_group(db, group_tid)
-        session = await get_active_session_any(db, group.id)
-
-        if not session:
-            await replace_bot_message(
-                message, state,
-                "📋 <b>Сессии</b>\n\nНет активной сессии.",
-                reply_markup=get_admin_no_session_keyboard(),
-            )
-            return
-
-        text = await _format_session_info(db, session)
-        keyboard = _get_session_keyboard(session.status)
+    session = await _get_active_session(db, state)
 
+    if not session:
         await replace_bot_message(
             message, state,
-            text,
-            reply_markup=keyboard,
+            _NO_SESSION_TEXT,
+            reply_markup=get_admin_no_session_keyboard(),
         )
+        return
+
+    text = await _format_session_info(db, session)
+    keyboard = _get_session_keyboard(session.status)
+
+    await replace_bot_message(
+        message, state,
+        text,
+        reply_markup=keyboard,
+    )
 
 
 # ── Session actions: collecting ──────────────────────────────────────────
 
 
 @router.message(F.text == BTN_ADM_FORCE_VOTING)
-async def admin_force_voting(message: Message, state: FSMContext) -> None:
+async def admin_force_voting(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
     """Force transition from collecting to voting."""
     await try_delete_message(message)
-    async with AsyncSessionLocal() as db:
-        session = await _get_active_session(db, await _get_admin_group_id(state))
-        if not session or session.status != STATUS_COLLECTING:
-            await replace_bot_message(
-                message, state,
-                "⚠️ Нет сессии в статусе «сбор предложений».",
-            )
-            return
-
-        ok = await set_session_status(db, session, STATUS_VOTING)
-        if not ok:
-            await replace_bot_message(message, state, "❌ Ошибка смены статуса.")
-            return
-
+    session = await _get_active_session(db, state)
+    if not session or session.status != STATUS_COLLECTING:
         await replace_bot_message(
             message, state,
-            "✅ Сессия переведена в статус <b>голосование</b>.\n\n"
-            "⚠️ Опросы в группе не создавались. "
-            "Используйте «Назначить победителя» или запустите голосование из группы.",
-            reply_markup=get_admin_sessions_voting_keyboard(),
+            "⚠️ Нет сессии в статусе «сбор предложений».",
         )
+        return
+
+    ok = await set_session_status(db, session, STATUS_VOTING)
+    if not ok:
+        await replace_bot_message(message, state, "❌ Ошибка смены статуса.")
+        return
+
+    await replace_bot_message(
+        message, state,
+        "✅ Сессия переведена в статус <b>голосование</b>.\n\n"
+        "⚠️ Опросы в группе не создавались. "
+        "Используйте «Назначить победителя» или запустите голосование из группы.",
+        reply_markup=get_admin_sessions_voting_keyboard(),
+    )
 
 
 @router.message(F.text == BTN_ADM_ADD_MOVIE)
-async def admin_add_movie_start(message: Message, state: FSMContext) -> None:
+async def admin_add_movie_start(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
     """Start adding a movie to the active session."""
     await try_delete_message(message)
-    async with AsyncSessionLocal() as db:
-        session = await _get_active_session(db, await _get_admin_group_id(state))
-        if not session or session.status != STATUS_COLLECTING:
-            await replace_bot_message(
-                message, state,
-                "⚠️ Нет сессии в статусе «сбор предложений».",
-            )
-            return
+    session = await _get_active_session(db, state)
+    if not session or session.status != STATUS_COLLECTING:
+        await replace_bot_message(
+            message, state,
+            "⚠️ Нет сессии в статусе «сбор предложений».",
+        )
+        return
 
     await state.set_state(AdminAddSlotMovieState.waiting_for_url)
     await state.update_data(return_to="sessions")
@@ -329,10 +453,12 @@ async def admin_add_movie_start(message: Message, state: FSMContext) -> None:
 
 
 @router.message(AdminAddSlotMovieState.waiting_for_url)
-async def admin_add_movie_url(message: Message, state: FSMContext) -> None:
+async def admin_add_movie_url(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
     """Handle movie URL for slot addition."""
     if message.text == BTN_BACK:
-        await _return_to_sessions(message, state)
+        await _return_to_sessions(message, state, db)
         return
 
     url = message.text.strip()
@@ -357,10 +483,12 @@ async def admin_add_movie_url(message: Message, state: FSMContext) -> None:
 
 
 @router.message(AdminAddSlotMovieState.waiting_for_slot)
-async def admin_add_movie_slot(message: Message, state: FSMContext) -> None:
+async def admin_add_movie_slot(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
     """Handle slot selection for movie addition."""
     if message.text == BTN_BACK:
-        await _return_to_sessions(message, state)
+        await _return_to_sessions(message, state, db)
         return
 
     text = message.text.strip()
@@ -381,140 +509,146 @@ async def admin_add_movie_slot(message: Message, state: FSMContext) -> None:
         await abort_flow(message, state, "❌ Данные фильма потеряны.")
         return
 
-    async with AsyncSessionLocal() as db:
-        try:
-            session = await _get_active_session(db, await _get_admin_group_id(state))
-            if not session:
-                await abort_flow(message, state, "❌ Активная сессия не найдена.")
-                return
-
-            system_user = await _get_or_create_system_user(db)
-            movie = Movie(
-                session_id=session.id,
-                user_id=system_user.id,
-                slot=slot,
-                kinopoisk_url=movie_data["kinopoisk_url"],
-                kinopoisk_id=movie_data["kinopoisk_id"],
-                title=movie_data["title"],
-                year=movie_data["year"],
-                genres=movie_data["genres"],
-                description=movie_data["description"],
-                poster_url=movie_data["poster_url"],
-                kinopoisk_rating=movie_data["kinopoisk_rating"],
-            )
-            db.add(movie)
-            await db.commit()
-
-            await state.set_state(AdminMenuState.sessions_menu)
-            await replace_bot_message(
-                message, state,
-                f"✅ Фильм <b>{movie_data['title']}</b> добавлен в слот {slot}.",
-                reply_markup=_get_session_keyboard(session.status),
-            )
-        except Exception as e:
-            logger.exception("Error adding movie to slot: %s", e)
-            await abort_flow(message, state, "❌ Ошибка при добавлении фильма.")
+    try:
+        session = await _get_active_session(db, state, data)
+        if not session:
+            await abort_flow(message, state, "❌ Активная сессия не найдена.")
+            return
+
+        system_user = await _get_or_create_system_user(db)
+        movie = Movie(
+            session_id=session.id,
+            user_id=system_user.id,
+            slot=slot,
+            kinopoisk_url=movie_data["kinopoisk_url"],
+            kinopoisk_id=movie_data["kinopoisk_id"],
+            title=movie_data["title"],
+            year=movie_data["year"],
+            genres=movie_data["genres"],
+            description=movie_data["description"],
+            poster_url=movie_data["poster_url"],
+            kinopoisk_rating=movie_data["kinopoisk_rating"],
+        )
+        db.add(movie)
+        await db.commit()
+
+        await state.set_state(AdminMenuState.sessions_menu)
+        await replace_bot_message(
+            message, state,
+            f"✅ Фильм <b>{movie_data['title']}</b> добавлен в слот {slot}.",
+            reply_markup=_get_session_keyboard(session.status),
+        )
+    except Exception:
+        logger.exception("Error adding movie to slot")
+        await abort_flow(message, state, "❌ Ошибка при добавлении фильма.")
 
 
 @router.message(F.text == BTN_ADM_DEL_SLOT_MOVIE)
-async def admin_del_slot_movie(message: Message, state: FSMContext) -> None:
+async def admin_del_slot_movie(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
     """Show movies in active session for deletion."""
     await try_delete_message(message)
-    async with AsyncSessionLocal() as db:
-        session = await _get_active_session(db, await _get_admin_group_id(state))
-        if not session or session.status != STATUS_COLLECTING:
-            await replace_bot_message(
-                message, state,
-                "⚠️ Нет сессии в статусе «сбор предложений».",
-            )
-            return
-
-        movies = await get_session_movies(db, session.id)
-        if not movies:
-            await replace_bot_message(
-                message, state,
-                "ℹ️ В сессии нет фильмов.",
-                reply_markup=_get_session_keyboard(session.status),
-            )
-            return
-
-        text = "🗑 <b>Выберите фильм для удаления:</b>\n\n"
-        for m in movies:
-            text += f"Слот {m.slot}: <b>{m.title}</b>{format_year_suffix(m.year)}\n"
-            text += f"  /del_movie_{m.id}\n\n"
+    session = await _get_active_session(db, state)
+    if not session or session.status != STATUS_COLLECTING:
+        await replace_bot_message(
+            message, state,
+            "⚠️ Нет сессии в статусе «сбор предложений».",
+        )
+        return
 
+    movies = await get_session_movies(db, session.id)
+    if not movies:
         await replace_bot_message(
             message, state,
-            text,
+            "ℹ️ В сессии нет фильмов.",
             reply_markup=_get_session_keyboard(session.status),
         )
+        return
 
+    text = "🗑 <b>Выберите фильм для удаления:</b>\n\n" + "".join(
+        f"Слот {m.slot}: <b>{m.title}</b>{format_year_suffix(m.year)}\n"
+        f"  /del_movie_{m.id}\n\n"
+        for m in movies
+    )
 
-@router.message(F.text.regexp(r"^/del_movie_(\d+)$"))
-async def admin_del_movie_cmd(message: Message, state: FSMContext) -> None:
+    await replace_bot_message(
+        message, state,
+        text,
+        reply_markup=_get_session_keyboard(session.status),
+    )
+
+
+@router.message(
+    AdminMenuState.sessions_menu,
+    F.text.startswith(_DEL_MOVIE_CMD),
+)
+async def admin_del_movie_cmd(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
     """Delete a movie from active session by inline command."""
-    match = re.match(r"^/del_movie_(\d+)$", message.text)
-    if not match:
+    movie_id = _inline_command_id(message.text, _DEL_MOVIE_CMD)
+    if movie_id is None:
         return
-    movie_id = int(match.group(1))
     await try_delete_message(message)
 
-    async with AsyncSessionLocal() as db:
-        ok = await delete_movie_by_id(db, movie_id)
-        if ok:
-            await replace_bot_message(
-                message, state,
-                f"✅ Фильм (ID {movie_id}) удалён из сессии.",
-            )
-        else:
-            await replace_bot_message(
-                message, state,
-                f"❌ Фильм с ID {movie_id} не найден.",
-            )
+    ok = await delete_movie_by_id(db, movie_id)
+    if ok:
+        await replace_bot_message(
+            message, state,
+            f"✅ Фильм (ID {movie_id}) удалён из сессии.",
+        )
+    else:
+        await replace_bot_message(
+            message, state,
+            f"❌ Фильм с ID {movie_id} не найден.",
+        )
 
 
 # ── Session actions: voting ──────────────────────────────────────────────
 
 
 @router.message(F.text == BTN_ADM_FORCE_FINISH_VOTE)
-async def admin_force_finish_vote(message: Message, state: FSMContext) -> None:
+async def admin_force_finish_vote(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
     """Force finish voting and transition to rating."""
     await try_delete_message(message)
-    async with AsyncSessionLocal() as db:
-        session = await _get_active_session(db, await _get_admin_group_id(state))
-        if not session or session.status != STATUS_VOTING:
-            await replace_bot_message(
-                message, state,
-                "⚠️ Нет сессии в статусе «голосование».",
-            )
-            return
-
-        ok = await set_session_status(db, session, STATUS_RATING)
-        if not ok:
-            await replace_bot_message(message, state, "❌ Ошибка смены статуса.")
-            return
-
+    session = await _get_active_session(db, state)
+    if not session or session.status != STATUS_VOTING:
         await replace_bot_message(
             message, state,
-            "✅ Голосование завершено, сессия переведена в статус <b>рейтинг</b>.\n\n"
-            "⚠️ Победители не определены автоматически. "
-            "Назначьте победителей вручную или добавьте рейтинги.",
-            reply_markup=get_admin_sessions_rating_keyboard(),
+            "⚠️ Нет сессии в статусе «голосование».",
         )
+        return
+
+    ok = await set_session_status(db, session, STATUS_RATING)
+    if not ok:
+        await replace_bot_message(message, state, "❌ Ошибка смены статуса.")
+        return
+
+    await replace_bot_message(
+        message, state,
+        "✅ Голосование завершено, сессия переведена в статус <b>рейтинг</b>.\n\n"
+        "⚠️ Победители не определены автоматически. "
+        "Назначьте победителей вручную или добавьте рейтинги.",
+        reply_markup=get_admin_sessions_rating_keyboard(),
+    )
 
 
 @router.message(F.text == BTN_ADM_SET_WINNER)
-async def admin_set_winner_start(message: Message, state: FSMContext) -> None:
+async def admin_set_winner_start(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
     """Start setting a winner manually."""
     await try_delete_message(message)
-    async with AsyncSessionLocal() as db:
-        session = await _get_active_session(db, await _get_admin_group_id(state))
-        if not session or session.status != STATUS_VOTING:
-            await replace_bot_message(
-                message, state,
-                "⚠️ Нет сессии в статусе «голосование».",
-            )
-            return
+    session = await _get_active_session(db, state)
+    if not session or session.status != STATUS_VOTING:
+        await replace_bot_message(
+            message, state,
+            "⚠️ Нет сессии в статусе «голосование».",
+        )
+        return
 
     await state.set_state(AdminSetWinnerState.waiting_for_slot)
     await replace_bot_message(
@@ -525,10 +659,12 @@ async def admin_set_winner_start(message: Message, state: FSMContext) -> None:
 
 
 @router.message(AdminSetWinnerState.waiting_for_slot)
-async def admin_set_winner_slot(message: Message, state: FSMContext) -> None:
+async def admin_set_winner_slot(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
     """Handle slot selection for winner assignment."""
     if message.text == BTN_BACK:
-        await _return_to_sessions(message, state)
+        await _return_to_sessions(message, state, db)
         return
 
     text = message.text.strip()
@@ -541,149 +677,160 @@ async def admin_set_winner_slot(message: Message, state: FSMContext) -> None:
     slot = int(text)
     await state.update_data(winner_slot=slot)
 
-    async with AsyncSessionLocal() as db:
-        session = await _get_active_session(db, await _get_admin_group_id(state))
-        if not session:
-            await abort_flow(message, state, "❌ Сессия не найдена.")
-            return
+    session = await _get_active_session(db, state)
+    if not session:
+        await abort_flow(message, state, "❌ Сессия не найдена.")
+        return
 
-        movies = await get_session_movies(db, session.id)
-        slot_movies = [m for m in movies if m.slot == slot]
+    movies = await get_session_movies(db, session.id)
+    slot_movies = [m for m in movies if m.slot == slot]
 
-        if not slot_movies:
-            await replace_bot_message(
-                message, state,
-                f"ℹ️ В слоте {slot} нет фильмов.\nВведите другой слот (1 или 2):",
-            )
-            return
+    if not slot_movies:
+        await replace_bot_message(
+            message, state,
+            f"ℹ️ В слоте {slot} нет фильмов.\nВведите другой слот (1 или 2):",
+        )
+        return
 
-        await state.set_state(AdminSetWinnerState.waiting_for_movie_choice)
-        text = f"🏆 Фильмы в слоте {slot}:\n\n"
-        for m in slot_movies:
-            text += f"<b>{m.title}</b>{format_year_suffix(m.year)}\n"
-            text += f"  /set_winner_{m.id}\n\n"
+    await state.set_state(AdminSetWinnerState.waiting_for_movie_choice)
+    text = f"🏆 Фильмы в слоте {slot}:\n\n" + "".join(
+        f"<b>{m.title}</b>{format_year_suffix(m.year)}\n"
+        f"  /set_winner_{m.id}\n\n"
+        for m in slot_movies
+    )
 
-        await replace_bot_message(message, state, text)
+    await replace_bot_message(message, state, text)
 
 
-@router.message(F.text.regexp(r"^/set_winner_(\d+)$"))
-async def admin_set_winner_cmd(message: Message, state: FSMContext) -> None:
+@router.message(
+    AdminSetWinnerState.waiting_for_movie_choice,
+    F.text.startswith(_SET_WINNER_CMD),
+)
+async def admin_set_winner_cmd(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
     """Set a movie as winner by inline command."""
-    match = re.match(r"^/set_winner_(\d+)$", message.text)
-    if not match:
+    movie_id = _inline_command_id(message.text, _SET_WINNER_CMD)
+    if movie_id is None:
         return
-
-    movie_id = int(match.group(1))
     data = await state.get_data()
     slot = data.get("winner_slot")
     await try_delete_message(message)
 
-    async with AsyncSessionLocal() as db:
-        session = await _get_active_session(db, await _get_admin_group_id(state))
-        movie = await get_movie_by_id(db, movie_id)
+    session = await _get_active_session(db, state, data)
+    movie = await get_movie_by_id(db, movie_id)
 
-        if not session or not movie:
-            await abort_flow(message, state, "❌ Сессия или фильм не найдены.")
-            return
+    if not session or not movie:
+        await abort_flow(message, state, "❌ Сессия или фильм не найдены.")
+        return
 
-        if slot == 1:
-            session.winner_slot1_id = movie.id
-        else:
-            session.winner_slot2_id = movie.id
-        await db.commit()
+    if slot == 1:
+        session.winner_slot1_id = movie.id
+    else:
+        session.winner_slot2_id = movie.id
+    await db.commit()
 
-        await state.set_state(AdminMenuState.sessions_menu)
-        await replace_bot_message(
-            message, state,
-            f"✅ Победитель слота {slot}: <b>{movie.title}</b>{format_year_suffix(movie.year)}",
-            reply_markup=_get_session_keyboard(session.status),
-        )
+    await state.set_state(AdminMenuState.sessions_menu)
+    await replace_bot_message(
+        message, state,
+        f"✅ Победитель слота {slot}: <b>{movie.title}</b>{format_year_suffix(movie.year)}",
+        reply_markup=_get_session_keyboard(session.status),
+    )
 
 
 @router.message(F.text == BTN_ADM_BACK_COLLECTING)
-async def admin_back_to_collecting(message: Message, state: FSMContext) -> None:
+async def admin_back_to_collecting(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
     """Roll back session from voting to collecting."""
     await try_delete_message(message)
-    async with AsyncSessionLocal() as db:
-        session = await _get_active_session(db, await _get_admin_group_id(state))
-        if not session or session.status != STATUS_VOTING:
-            await replace_bot_message(
-                message, state, "⚠️ Нет сессии в статусе «голосование».",
-            )
-            return
-
-        await set_session_status(db, session, STATUS_COLLECTING)
+    session = await _get_active_session(db, state)
+    if not session or session.status != STATUS_VOTING:
         await replace_bot_message(
-            message, state,
-            "✅ Сессия возвращена в статус <b>сбор предложений</b>.",
-            reply_markup=get_admin_sessions_collecting_keyboard(),
+            message, state, "⚠️ Нет сессии в статусе «голосование».",
         )
+        return
+
+    await set_session_status(db, session, STATUS_COLLECTING)
+    await replace_bot_message(
+        message, state,
+        "✅ Сессия возвращена в статус <b>сбор предложений</b>.",
+        reply_markup=get_admin_sessions_collecting_keyboard(),
+    )
 
 
 # ── Session actions: rating ──────────────────────────────────────────────
 
 
 @router.message(F.text == BTN_ADM_FORCE_COMPLETE)
-async def admin_force_complete(message: Message, state: FSMContext) -> None:
+async def admin_force_complete(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
     """Force complete the session."""
     await try_delete_message(message)
-    async with AsyncSessionLocal() as db:
-        session = await _get_active_session(db, await _get_admin_group_id(state))
-        if not session or session.status != STATUS_RATING:
-            await replace_bot_message(
-                message, state, "⚠️ Нет сессии в статусе «рейтинг».",
-            )
-            return
-
-        await set_session_status(db, session, STATUS_COMPLETED)
-        await state.set_state(AdminMenuState.sessions_menu)
+    session = await _get_active_session(db, state)
+    if not session or session.status != STATUS_RATING:
         await replace_bot_message(
-            message, state,
-            "✅ Сессия завершена.",
-            reply_markup=get_admin_no_session_keyboard(),
+            message, state, "⚠️ Нет сессии в статусе «рейтинг».",
         )
+        return
+
+    await set_session_status(db, session, STATUS_COMPLETED)
+    await state.set_state(AdminMenuState.sessions_menu)
+    await replace_bot_message(
+        message, state,
+        "✅ Сессия завершена.",
+        reply_markup=get_admin_no_session_keyboard(),
+    )
 
 
 @router.message(F.text == BTN_ADM_ADD_RATINGS)
-async def admin_add_ratings_start(message: Message, state: FSMContext) -> None:
+async def admin_add_ratings_start(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
     """Start adding ratings for a winner movie."""
     await try_delete_message(message)
-    async with AsyncSessionLocal() as db:
-        session = await _get_active_session(db, await _get_admin_group_id(state))
-        if not session or session.status != STATUS_RATING:
-            await replace_bot_message(
-                message, state, "⚠️ Нет сессии в статусе «рейтинг».",
-            )
-            return
-
-        winners = _get_winner_movies(session)
-        if not winners:
-            await replace_bot_message(
-                message, state,
-                "⚠️ У сессии нет фильмов-победителей. Назначьте победителей.",
-            )
-            return
-
-        text = "📊 <b>Выберите фильм для добавления рейтингов:</b>\n\n"
-        for m in winners:
-            text += f"<b>{m.title}</b>{format_year_suffix(m.year)}\n"
-            text += f"  /add_rating_{m.id}\n\n"
+    session = await _get_active_session(db, state)
+    if not session or session.status != STATUS_RATING:
+        await replace_bot_message(
+            message, state, "⚠️ Нет сессии в статусе «рейтинг».",
+        )
+        return
 
-        await state.set_state(AdminAddRatingsState.waiting_for_movie_choice)
+    winners = await get_winner_movies(db, session)
+    if not winners:
         await replace_bot_message(
-            message, state, text,
-            reply_markup=get_admin_back_keyboard(),
+            message, state,
+            "⚠️ У сессии нет фильмов-победителей. Назначьте победителей.",
         )
+        return
 
+    text = "📊 <b>Выберите фильм для добавления рейтингов:</b>\n\n" + "".join(
+        f"<b>{m.title}</b>{format_year_suffix(m.year)}\n"
+        f"  /add_rating_{m.id}\n\n"
+        for m in winners
+    )
 
-@router.message(F.text.regexp(r"^/add_rating_(\d+)$"))
-async def admin_add_rating_select(message: Message, state: FSMContext) -> None:
+    await state.set_state(AdminAddRatingsState.waiting_for_movie_choice)
+    # Lets admin_add_ratings_input pick the keyboard without a re-fetch
+    await state.update_data(rating_session_status=session.status)
+    await replace_bot_message(
+        message, state, text,
+        reply_markup=get_admin_back_keyboard(),
+    )
+
+
+@router.message(
+    AdminAddRatingsState.waiting_for_movie_choice,
+    F.text.startswith(_ADD_RATING_CMD),
+)
+async def admin_add_rating_select(
+    message: Message, state: FSMContext,
+) -> None:
     """Select movie for rating input."""
-    match = re.match(r"^/add_rating_(\d+)$", message.text)
-    if not match:
+    movie_id = _inline_command_id(message.text, _ADD_RATING_CMD)
+    if movie_id is None:
         return
-
-    movie_id = int(match.group(1))
     await try_delete_message(message)
     await state.update_data(rating_movie_id=movie_id)
     await state.set_state(AdminAddRatingsState.waiting_for_ratings)
@@ -698,10 +845,12 @@ async def admin_add_rating_select(message: Message, state: FSMContext) -> None:
 
 
 @router.message(AdminAddRatingsState.waiting_for_ratings)
-async def admin_add_ratings_input(message: Message, state: FSMContext) -> None:
+async def admin_add_ratings_input(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
     """Handle ratings text input."""
     if message.text == BTN_BACK:
-        await _return_to_sessions(message, state)
+        await _return_to_sessions(message, state, db)
         return
 
     text = message.text.strip()
@@ -724,76 +873,75 @@ async def admin_add_ratings_input(message: Message, state: FSMContext) -> None:
         )
         return
 
-    async with AsyncSessionLocal() as db:
-        try:
-            movie = await get_movie_by_id(db, movie_id)
-            if not movie:
-                await abort_flow(message, state, "❌ Фильм не найден.")
-                return
-
-            added = await _save_ratings_batch(db, movie.session_id, movie_id, ratings)
-            await db.commit()
-
-            avg = await recalc_club_rating(db, movie_id)
-
-            await state.set_state(AdminMenuState.sessions_menu)
-            session = await _get_active_session(db, await _get_admin_group_id(state))
-            avg_str = f"{avg:.2f}" if avg else "—"
-            await replace_bot_message(
-                message, state,
-                f"✅ Добавлено {added} рейтингов.\n"
-                f"Рейтинг КК: ⭐ {avg_str}",
-                reply_markup=_get_session_keyboard(
-                    session.status if session else STATUS_COMPLETED
-                ),
-            )
-        except Exception as e:
-            logger.exception("Error adding ratings: %s", e)
-            await abort_flow(message, state, "❌ Ошибка при добавлении рейтингов.")
+    try:
+        added = await _save_ratings_batch(db, movie_id, ratings)
+        if not added:
+            # Nothing inserted: the movie is gone; placeholders roll back
+            await abort_flow(message, state, "❌ Фильм не найден.")
+            return
+
+        # Recalculated in the same transaction; recalc_club_rating commits
+        avg = await recalc_club_rating(db, movie_id)
+
+        await state.set_state(AdminMenuState.sessions_menu)
+        avg_str = f"{avg:.2f}" if avg else "—"
+        await replace_bot_message(
+            message, state,
+            f"✅ Добавлено {added} рейтингов.\n"
+            f"Рейтинг КК: ⭐ {avg_str}",
+            reply_markup=_get_session_keyboard(
+                data.get("rating_session_status", STATUS_COMPLETED)
+            ),
+        )
+    except Exception:
+        logger.exception("Error adding ratings")
+        await abort_flow(message, state, "❌ Ошибка при добавлении рейтингов.")
 
 
 @router.message(F.text == BTN_ADM_BACK_VOTING)
-async def admin_back_to_voting(message: Message, state: FSMContext) -> None:
+async def admin_back_to_voting(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
     """Roll back session from rating to voting."""
     await try_delete_message(message)
-    async with AsyncSessionLocal() as db:
-        session = await _get_active_session(db, await _get_admin_group_id(state))
-        if not session or session.status != STATUS_RATING:
-            await replace_bot_message(
-                message, state, "⚠️ Нет сессии в статусе «рейтинг».",
-            )
-            return
-
-        await set_session_status(db, session, STATUS_VOTING)
+    session = await _get_active_session(db, state)
+    if not session or session.status != STATUS_RATING:
         await replace_bot_message(
-            message, state,
-            "✅ Сессия возвращена в статус <b>голосование</b>.",
-            reply_markup=get_admin_sessions_voting_keyboard(),
+            message, state, "⚠️ Нет сессии в статусе «рейтинг».",
         )
+        return
+
+    await set_session_status(db, session, STATUS_VOTING)
+    await replace_bot_message(
+        message, state,
+        "✅ Сессия возвращена в статус <b>голосование</b>.",
+        reply_markup=get_admin_sessions_voting_keyboard(),
+    )
 
 
 # ── Session actions: common ──────────────────────────────────────────────
 
 
 @router.message(F.text == BTN_ADM_CANCEL_SESSION)
-async def admin_cancel_session(message: Message, state: FSMContext) -> None:
+async def admin_cancel_session(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
     """Cancel (complete) the active session."""
     await try_delete_message(message)
-    async with AsyncSessionLocal() as db:
-        session = await _get_active_session(db, await _get_admin_group_id(state))
-        if not session:
-            await replace_bot_message(
-                message, state, "⚠️ Нет активной сессии.",
-            )
-            return
-
-        await set_session_status(db, session, STATUS_COMPLETED)
-        await state.set_state(AdminMenuState.sessions_menu)
+    session = await _get_active_session(db, state)
+    if not session:
         await replace_bot_message(
-            message, state,
-            "✅ Сессия отменена (завершена).",
-            reply_markup=get_admin_no_session_keyboard(),
+            message, state, "⚠️ Нет активной сессии.",
         )
+        return
+
+    await set_session_status(db, session, STATUS_COMPLETED)
+    await state.set_state(AdminMenuState.sessions_menu)
+    await replace_bot_message(
+        message, state,
+        "✅ Сессия отменена (завершена).",
+        reply_markup=get_admin_no_session_keyboard(),
+    )
 
 
 # ══════════════════════════════════════════════════════════════════════════
@@ -804,32 +952,34 @@ async def admin_cancel_session(message: Message, state: FSMContext) -> None:
 @router.message(F.text == BTN_ADMIN_MOVIES)
 async def admin_movies(message: Message, state: FSMContext) -> None:
     """Show movies sub-menu."""
-    await try_delete_message(message)
     await state.set_state(AdminMenuState.movies_menu)
-    await replace_bot_message(
+    await swap_ui(
         message, state,
-        "🎬 <b>Фильмы</b>\n\nВыберите действие:",
+        _MOVIES_MENU_TEXT,
         reply_markup=get_admin_movies_keyboard(),
     )
 
 
 @router.message(F.text == BTN_ADM_MOVIE_LIST)
-async def admin_movie_list(message: Message, state: FSMContext) -> None:
+async def admin_movie_list(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
     """Show paginated movie list with inline actions."""
     await try_delete_message(message)
-    await _send_movie_list_page(message, state, page=1)
+    await _send_movie_list_page(message, state, db, page=1)
 
 
 @router.callback_query(F.data.startswith("adm_movies_page:"))
-async def admin_movie_list_page(callback: CallbackQuery, state: FSMContext) -> None:
+async def admin_movie_list_page(
+    callback: CallbackQuery, state: FSMContext, db: AsyncSession,
+) -> None:
     """Handle movie list pagination."""
+    await callback.answer()
     page_str = callback.data.split(":")[1]
     if page_str == "noop":
-        await callback.answer()
         return
 
     page = int(page_str)
-    await callback.answer()
 
     # Delete old message and send a new one
     try:
@@ -837,15 +987,14 @@ async def admin_movie_list_page(callback: CallbackQuery, state: FSMContext) -> N
     except Exception:
         pass
 
-    await _send_movie_list_page(callback.message, state, page)
+    await _send_movie_list_page(callback.message, state, db, page)
 
 
 @router.message(F.text == BTN_ADM_MOVIE_SEARCH)
 async def admin_movie_search_start(message: Message, state: FSMContext) -> None:
     """Start movie search by title."""
-    await try_delete_message(message)
     await state.set_state(AdminSearchMovieState.waiting_for_query)
-    await replace_bot_message(
+    await swap_ui(
         message, state,
         "🔍 Введите название фильма для поиска:",
         reply_markup=get_admin_back_keyboard(),
@@ -853,14 +1002,15 @@ async def admin_movie_search_start(message: Message, state: FSMContext) -> None:
 
 
 @router.message(AdminSearchMovieState.waiting_for_query)
-async def admin_movie_search_input(message: Message, state: FSMContext) -> None:
+async def admin_movie_search_input(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
     """Handle search query input."""
     if message.text == BTN_BACK:
-        await try_delete_message(message)
         await state.set_state(AdminMenuState.movies_menu)
-        await replace_bot_message(
+        await swap_ui(
             message, state,
-            "🎬 <b>Фильмы</b>\n\nВыберите действие:",
+            _MOVIES_MENU_TEXT,
             reply_markup=get_admin_movies_keyboard(),
         )
         return
@@ -868,8 +1018,7 @@ async def admin_movie_search_input(message: Message, state: FSMContext) -> None:
     query = message.text.strip()
     await try_delete_message(message)
 
-    async with AsyncSessionLocal() as db:
-        movies = await search_movies_by_title(db, query)
+    movies = await search_movies_by_title(db, query)
 
     if not movies:
         await replace_bot_message(
@@ -880,44 +1029,29 @@ async def admin_movie_search_input(message: Message, state: FSMContext) -> None:
         return
 
     await state.set_state(AdminMenuState.movies_menu)
-
-    # Delete old bot message and send search results
-    data = await state.get_data()
-    old_msg_id = data.get("bot_message_id")
-    if old_msg_id:
-        try:
-            await message.bot.delete_message(message.chat.id, old_msg_id)
-        except Exception:
-            pass
-
-    for movie in movies:
-        text = _format_movie_card(movie)
-        await message.answer(
-            text,
-            reply_markup=get_admin_movie_actions_keyboard(movie.id),
-        )
-
-    nav_msg = await message.answer(
+    await _send_movie_cards(
+        message, state, movies, 1,
         f"🔍 Найдено: {len(movies)}",
-        reply_markup=get_admin_movies_keyboard(),
+        get_admin_movies_keyboard(),
     )
-    await state.update_data(bot_message_id=nav_msg.message_id)
 
 
 # ── Movie inline actions ─────────────────────────────────────────────────
 
 
 @router.callback_query(F.data.startswith("adm_edit_rating:"))
-async def admin_edit_rating_start(callback: CallbackQuery, state: FSMContext) -> None:
+async def admin_edit_rating_start(
+    callback: CallbackQuery, state: FSMContext, db: AsyncSession,
+) -> None:
     """Start editing club rating for a movie."""
     movie_id = int(callback.data.split(":")[1])
     await callback.answer()
 
-    async with AsyncSessionLocal() as db:
-        movie = await get_movie_by_id(db, movie_id)
+    movie = await get_movie_card(db, movie_id)
 
     if not movie:
-        await callback.answer("❌ Фильм не найден", show_alert=True)
+        # The query is already answered, so report via a message
+        await callback.message.answer("❌ Фильм не найден.")
         return
 
     current = f"{movie.club_rating:.2f}" if movie.club_rating else "не задан"
@@ -936,14 +1070,15 @@ async def admin_edit_rating_start(callback: CallbackQuery, state: FSMContext) ->
 
 
 @router.message(AdminEditRatingState.waiting_for_rating)
-async def admin_edit_rating_input(message: Message, state: FSMContext) -> None:
+async def admin_edit_rating_input(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
     """Handle new rating value input."""
     if message.text == BTN_BACK:
-        await try_delete_message(message)
         await state.set_state(AdminMenuState.movies_menu)
-        await replace_bot_message(
+        await swap_ui(
             message, state,
-            "🎬 <b>Фильмы</b>\n\nВыберите действие:",
+            _MOVIES_MENU_TEXT,
             reply_markup=get_admin_movies_keyboard(),
         )
         return
@@ -970,41 +1105,42 @@ async def admin_edit_rating_input(message: Message, state: FSMContext) -> None:
     data = await state.get_data()
     movie_id = data.get("edit_movie_id")
 
-    async with AsyncSessionLocal() as db:
-        try:
-            movie = await get_movie_by_id(db, movie_id)
-            if not movie:
-                await abort_flow(message, state, "❌ Фильм не найден.")
-                return
-
-            movie.club_rating = round(new_rating, 2)
-            await db.commit()
-
-            await state.set_state(AdminMenuState.movies_menu)
-            await replace_bot_message(
-                message, state,
-                f"✅ Рейтинг обновлён!\n\n"
-                f"🎬 {movie.title}{format_year_suffix(movie.year)}\n"
-                f"Новый рейтинг КК: ⭐ {movie.club_rating:.2f}",
-                reply_markup=get_admin_movies_keyboard(),
-            )
-        except Exception as e:
-            logger.exception("Error editing rating: %s", e)
-            await abort_flow(message, state, "❌ Ошибка при обновлении рейтинга.")
+    try:
+        movie = await get_movie_by_id(db, movie_id)
+        if not movie:
+            await abort_flow(message, state, "❌ Фильм не найден.")
+            return
+
+        movie.club_rating = round(new_rating, 2)
+        await db.commit()
+
+        await state.set_state(AdminMenuState.movies_menu)
+        await replace_bot_message(
+            message, state,
+            f"✅ Рейтинг обновлён!\n\n"
+            f"🎬 {movie.title}{format_year_suffix(movie.year)}\n"
+            f"Новый рейтинг КК: ⭐ {movie.club_rating:.2f}",
+            reply_markup=get_admin_movies_keyboard(),
+        )
+    except Exception:
+        logger.exception("Error editing rating")
+        await abort_flow(message, state, "❌ Ошибка при обновлении рейтинга.")
 
 
 @router.callback_query(F.data.startswith("adm_delete:"))
-async def admin_delete_movie_confirm(callback: CallbackQuery, state: FSMContext) -> None:  # noqa: ARG001
+async def admin_delete_movie_confirm(
+    callback: CallbackQuery, state: FSMContext, db: AsyncSession,
+) -> None:  # noqa: ARG001
     """Show deletion confirmation."""
     parts = callback.data.split(":")
     movie_id = int(parts[1])
     await callback.answer()
 
-    async with AsyncSessionLocal() as db:
-        movie = await get_movie_by_id(db, movie_id)
+    movie = await get_movie_card(db, movie_id)
 
     if not movie:
-        await callback.answer("❌ Фильм не найден", show_alert=True)
+        # The query is already answered, so report via a message
+        await callback.message.answer("❌ Фильм не найден.")
         return
 
     await callback.message.edit_text(
@@ -1016,15 +1152,16 @@ async def admin_delete_movie_confirm(callback: CallbackQuery, state: FSMContext)
 
 
 @router.callback_query(F.data.startswith("adm_delete_yes:"))
-async def admin_delete_movie_yes(callback: CallbackQuery, state: FSMContext) -> None:  # noqa: ARG001
+async def admin_delete_movie_yes(
+    callback: CallbackQuery, state: FSMContext, db: AsyncSession,
+) -> None:  # noqa: ARG001
     """Confirm and delete a movie."""
     movie_id = int(callback.data.split(":")[1])
     await callback.answer()
 
-    async with AsyncSessionLocal() as db:
-        movie = await get_movie_by_id(db, movie_id)
-        title = movie.title if movie else f"ID {movie_id}"
-        ok = await delete_movie_by_id(db, movie_id)
+    movie = await get_movie_by_id(db, movie_id)
+    title = movie.title if movie else f"ID {movie_id}"
+    ok = await delete_movie_by_id(db, movie_id)
 
     if ok:
         await callback.message.edit_text(f"✅ Фильм <b>{title}</b> удалён.")
@@ -1047,9 +1184,8 @@ async def admin_delete_movie_no(callback: CallbackQuery, state: FSMContext) -> N
 @router.message(F.text == BTN_ADMIN_BATCH)
 async def admin_batch_start(message: Message, state: FSMContext) -> None:
     """Start batch import flow."""
-    await try_delete_message(message)
     await state.set_state(AdminBatchImportState.waiting_for_data)
-    await replace_bot_message(
+    await swap_ui(
         message, state,
         "📥 <b>Batch-импорт фильмов</b>\n\n"
         "Отправьте список фильмов (одна строка = один фильм):\n\n"
@@ -1066,11 +1202,10 @@ async def admin_batch_start(message: Message, state: FSMContext) -> None:
 async def admin_batch_data(message: Message, state: FSMContext) -> None:
     """Parse batch import data."""
     if message.text == BTN_BACK:
-        await try_delete_message(message)
         await state.set_state(AdminMenuState.main_menu)
-        await replace_bot_message(
+        await swap_ui(
             message, state,
-            "👑 <b>Админ-панель</b>\n\nВыберите раздел:",
+            _ADMIN_PANEL_TEXT,
             reply_markup=get_admin_menu_keyboard(),
         )
         return
@@ -1089,22 +1224,35 @@ async def admin_batch_data(message: Message, state: FSMContext) -> None:
         return
 
     # Show progress message
-    await replace_bot_message(
+    total = len(entries)
+    progress = await replace_bot_message(
         message, state,
-        f"⏳ Загружаю данные о {len(entries)} фильмах с Кинопоиска...",
+        f"⏳ Загружаю данные о {total} фильмах с Кинопоиска...",
     )
 
-    # Parse all movies from KP
-    parsed: List[dict] = []
-    errors: List[str] = []
+    # Parse all movies from KP concurrently, updating the progress
+    # message as fetches finish; results are stored back in input order
+    semaphore = asyncio.Semaphore(_BATCH_FETCH_CONCURRENCY)
+    results: List[Tuple[Optional[dict], Optional[str]]] = [(None, None)] * total
+    last_update = time.monotonic()
+    for done, future in enumerate(asyncio.as_completed([
+        _fetch_batch_entry(semaphore, index, url, rating)
+        for index, (url, rating) in enumerate(entries)
+    ]), 1):
+        index, result = await future
+        results[index] = result
+        now = time.monotonic()
+        if done < total and now - last_update >= _BATCH_PROGRESS_INTERVAL:
+            last_update = now
+            try:
+                await progress.edit_text(
+                    f"⏳ Загружаю данные с Кинопоиска: {done}/{total}..."
+                )
+            except Exception:
+                pass
 
-    for url, rating in entries:
-        try:
-            movie_data = await parse_movie_data(url)
-            movie_data["club_rating"] = rating
-            parsed.append(movie_data)
-        except KinopoiskParserError as e:
-            errors.append(f"❌ {url}: {e}")
+    parsed = [movie_data for movie_data, _ in results if movie_data is not None]
+    errors = [error for _, error in results if error is not None]
 
     if not parsed:
         error_text = "\n".join(errors) if errors else "Ошибка парсинга."
@@ -1116,18 +1264,16 @@ async def admin_batch_data(message: Message, state: FSMContext) -> None:
         return
 
     # Build preview
-    preview = "📥 <b>Превью импорта:</b>\n\n"
-    for i, md in enumerate(parsed, 1):
-        year_str = format_year_suffix(md.get("year"))
-        preview += (
-            f"{i}. <b>{md['title']}</b>{year_str} "
-            f"— рейтинг КК: {md['club_rating']:.2f}\n"
-        )
-
+    parts = ["📥 <b>Превью импорта:</b>\n\n"]
+    parts.extend(
+        f"{i}. <b>{md['title']}</b>{format_year_suffix(md.get('year'))} "
+        f"— рейтинг КК: {md['club_rating']:.2f}\n"
+        for i, md in enumerate(parsed, 1)
+    )
     if errors:
-        preview += f"\n⚠️ Ошибки ({len(errors)}):\n" + "\n".join(errors[:5])
-
-    preview += "\n\n<b>Подтвердить импорт?</b>"
+        parts.append(f"\n⚠️ Ошибки ({len(errors)}):\n" + "\n".join(errors[:5]))
+    parts.append("\n\n<b>Подтвердить импорт?</b>")
+    preview = "".join(parts)
 
     await state.update_data(batch_parsed=parsed)
     await state.set_state(AdminBatchImportState.confirm)
@@ -1138,8 +1284,10 @@ async def admin_batch_data(message: Message, state: FSMContext) -> None:
     )
 
 
-@router.callback_query(F.data == "confirm:batch_import:yes")
-async def admin_batch_confirm(callback: CallbackQuery, state: FSMContext) -> None:
+@router.callback_query(_BATCH_IMPORT_YES)
+async def admin_batch_confirm(
+    callback: CallbackQuery, state: FSMContext, db: AsyncSession,
+) -> None:
     """Confirm and execute batch import."""
     data = await state.get_data()
     parsed = data.get("batch_parsed", [])
@@ -1150,59 +1298,48 @@ async def admin_batch_confirm(callback: CallbackQuery, state: FSMContext) -> Non
         await state.clear()
         return
 
-    async with AsyncSessionLocal() as db:
-        try:
-            group = await get_or_create_group(db, data["admin_group_id"])
-            system_user = await _get_or_create_system_user(db)
-            imported = 0
-
-            for md in parsed:
-                session = await create_completed_session_for_import(
-                    db, group.id, system_user.id,
-                )
-                movie = Movie(
-                    session_id=session.id,
-                    user_id=system_user.id,
-                    slot=1,
-                    kinopoisk_url=md["kinopoisk_url"],
-                    kinopoisk_id=md["kinopoisk_id"],
-                    title=md["title"],
-                    year=md["year"],
-                    genres=md["genres"],
-                    description=md["description"],
-                    poster_url=md["poster_url"],
-                    kinopoisk_rating=md["kinopoisk_rating"],
-                    club_rating=round(md["club_rating"], 2),
-                )
-                db.add(movie)
-                await db.flush()
-
-                session.winner_slot1_id = movie.id
-                await db.flush()
-                imported += 1
-
-            await db.commit()
+    try:
+        group_id = await _get_admin_group_db_id(db, state, data)
+        system_user = await _get_or_create_system_user(db)
+        imported = await import_completed_movies(
+            db, group_id, system_user.id,
+            [
+                {
+                    "kinopoisk_url": md["kinopoisk_url"],
+                    "kinopoisk_id": md["kinopoisk_id"],
+                    "title": md["title"],
+                    "year": md["year"],
+                    "genres": md["genres"],
+                    "description": md["description"],
+                    "poster_url": md["poster_url"],
+                    "kinopoisk_rating": md["kinopoisk_rating"],
+                    "club_rating": round(md["club_rating"], 2),
+                }
+                for md in parsed
+            ],
+        )
+        await db.commit()
 
-            await state.set_state(AdminMenuState.main_menu)
-            await callback.message.edit_text(
-                f"✅ <b>Импорт завершён!</b>\n\n"
-                f"Импортировано фильмов: {imported}"
-            )
+        await state.set_state(AdminMenuState.main_menu)
+        await callback.message.edit_text(
+            f"✅ <b>Импорт завершён!</b>\n\n"
+            f"Импортировано фильмов: {imported}"
+        )
 
-            await callback.message.answer(
-                "👑 <b>Админ-панель</b>\n\nВыберите раздел:",
-                reply_markup=get_admin_menu_keyboard(),
-            )
+        await callback.message.answer(
+            _ADMIN_PANEL_TEXT,
+            reply_markup=get_admin_menu_keyboard(),
+        )
 
-        except Exception as e:
-            logger.exception("Batch import error: %s", e)
-            await callback.message.edit_text(
-                f"❌ Ошибка импорта: {e}"
-            )
-            await state.clear()
+    except Exception as e:
+        logger.exception("Batch import error")
+        await callback.message.edit_text(
+            f"❌ Ошибка импорта: {e}"
+        )
+        await state.clear()
 
 
-@router.callback_query(F.data == "confirm:batch_import:no")
+@router.callback_query(_BATCH_IMPORT_NO)
 async def admin_batch_cancel(callback: CallbackQuery, state: FSMContext) -> None:
     """Cancel batch import."""
     await callback.answer()
@@ -1210,7 +1347,7 @@ async def admin_batch_cancel(callback: CallbackQuery, state: FSMContext) -> None
     await callback.message.edit_text("❌ Импорт отменён.")
 
     await callback.message.answer(
-        "👑 <b>Админ-панель</b>\n\nВыберите раздел:",
+        _ADMIN_PANEL_TEXT,
         reply_markup=get_admin_menu_keyboard(),
     )
 
@@ -1221,34 +1358,39 @@ async def admin_batch_cancel(callback: CallbackQuery, state: FSMContext) -> None
 
 
 @router.message(F.text == BTN_ADMIN_STATS)
-async def admin_db_stats(message: Message, state: FSMContext) -> None:
+async def admin_db_stats(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
     """Show database statistics."""
-    await try_delete_message(message)
+    try:
+        # All five counts in one round-trip, overlapped with the delete
+        result, _ = await asyncio.gather(
+            db.execute(_DB_STATS_QUERY), try_delete_message(message),
+        )
+        counts = result.one()._mapping
+
+        lines = []
+        any_estimated = False
+        for label, model in _DB_STATS_TABLES:
+            name = model.__tablename__
+            estimated = counts[f"{name}_estimated"]
+            any_estimated = any_estimated or estimated
+            prefix = "≈" if estimated else ""
+            lines.append(f"{label}: {prefix}{counts[name]}")
+        if any_estimated:
+            lines.append("\n≈ — оценка по статистике PostgreSQL")
 
-    async with AsyncSessionLocal() as db:
-        try:
-            users = (await db.execute(select(func.count(User.id)))).scalar()
-            groups = (await db.execute(select(func.count(Group.id)))).scalar()
-            sessions = (await db.execute(select(func.count(Session.id)))).scalar()
-            movies = (await db.execute(select(func.count(Movie.id)))).scalar()
-            ratings = (await db.execute(select(func.count(Rating.id)))).scalar()
-
-            await replace_bot_message(
-                message, state,
-                "📊 <b>СТАТИСТИКА БАЗЫ ДАННЫХ</b>\n\n"
-                f"👥 Пользователей: {users}\n"
-                f"🏢 Групп: {groups}\n"
-                f"📅 Сессий: {sessions}\n"
-                f"🎬 Фильмов: {movies}\n"
-                f"⭐ Рейтингов: {ratings}",
-                reply_markup=get_admin_menu_keyboard(),
-            )
-        except Exception as e:
-            logger.exception("Error showing DB stats: %s", e)
-            await replace_bot_message(
-                message, state,
-                "❌ Ошибка при получении статистики.",
-            )
+        await replace_bot_message(
+            message, state,
+            "📊 <b>СТАТИСТИКА БАЗЫ ДАННЫХ</b>\n\n" + "\n".join(lines),
+            reply_markup=get_admin_menu_keyboard(),
+        )
+    except Exception:
+        logger.exception("Error showing DB stats")
+        await replace_bot_message(
+            message, state,
+            "❌ Ошибка при получении статистики.",
+        )
 
 
 # ══════════════════════════════════════════════════════════════════════════
@@ -1280,7 +1422,7 @@ async def admin_logs(message: Message, state: FSMContext) -> None:
 
     await replace_bot_message(
         message, state,
-        f"📜 <b>Последние логи:</b>\n\n<pre>{_escape_html(log_text)}</pre>",
+        f"📜 <b>Последние логи:</b>\n\n<pre>{html_lib.escape(log_text, quote=False)}</pre>",
         reply_markup=get_admin_menu_keyboard(),
     )
 
@@ -1290,34 +1432,75 @@ async def admin_logs(message: Message, state: FSMContext) -> None:
 # ══════════════════════════════════════════════════════════════════════════
 
 
-async def _get_active_session(db, group_telegram_id: int) -> Optional[Session]:
-    """Get any active session for the given group."""
-    group = await get_or_create_group(db, group_telegram_id)
-    return await get_active_session_any(db, group.id)
+async def _get_active_session(
+    db, state: FSMContext, data: Optional[dict] = None,
+) -> Optional[Session]:
+    """Get any active session for the selected admin group.
+
+    The session id is remembered in FSM data, so repeated admin actions
+    on the same session load it by primary key. The cached session is
+    re-validated and the full lookup runs again once it is completed.
+    Pass *data* when the caller has already read the FSM data.
+    """
+    if data is None:
+        data = await state.get_data()
+    group_db_id = data.get("admin_group_db_id")
+    session_id = data.get("admin_session_id")
+    if group_db_id is not None and session_id is not None:
+        session = await db.get(Session, session_id)
+        if (
+            session is not None
+            and session.group_id == group_db_id
+            and session.status != STATUS_COMPLETED
+        ):
+            return session
+
+    if group_db_id is not None:
+        session = await get_active_session_any(db, group_db_id)
+    else:
+        # First lookup: resolve the group and its session in one query
+        found = await get_group_active_session(db, data.get("admin_group_id"))
+        if found is None:
+            # Group row does not exist yet, so it cannot have sessions
+            await _get_admin_group_db_id(db, state, data)
+            return None
+        group_db_id, session = found
+
+    await state.update_data(
+        admin_group_db_id=group_db_id,
+        admin_session_id=session.id if session else None,
+    )
+    return session
 
 
 async def _format_session_info(db, session: Session) -> str:
-    """Format session info text for the admin panel."""
-    movies = await get_session_movies(db, session.id)
-    status_label = session.status_obj.name if session.status_obj else session.status
+    """Format session info text for the admin panel.
+
+    Status and winners come from the session's own columns, so the only
+    query is the lightweight movie listing.
+    """
+    movies = await get_session_movies_lite(db, session.id)
+    status_label = STATUS_NAMES.get(session.status, session.status)
 
     text = (
         f"📋 <b>Активная сессия #{session.id}</b>\n\n"
         f"Статус: <b>{status_label}</b>\n"
-        f"Создана: {session.created_at.strftime('%d.%m.%Y %H:%M')}\n"
+        f"Создана: {format_datetime(session.created_at)}\n"
         f"Фильмов: {len(movies)}\n"
     )
 
+    parts = [text]
     if movies:
-        text += "\n"
+        parts.append("\n")
+        winner_ids = (session.winner_slot1_id, session.winner_slot2_id)
         for m in movies:
-            winner_mark = ""
-            if session.winner_slot1_id == m.id or session.winner_slot2_id == m.id:
-                winner_mark = " 🏆"
-            text += f"  Слот {m.slot}: {m.title}{format_year_suffix(m.year)}{winner_mark}\n"
+            winner_mark = " 🏆" if m.id in winner_ids else ""
+            parts.append(
+                f"  Слот {m.slot}: {m.title}{format_year_suffix(m.year)}{winner_mark}\n"
+            )
 
-    text += "\nВыберите действие:"
-    return text
+    parts.append("\nВыберите действие:")
+    return "".join(parts)
 
 
 def _get_session_keyboard(status: str):
@@ -1331,84 +1514,91 @@ def _get_session_keyboard(status: str):
     return get_admin_no_session_keyboard()
 
 
-def _get_winner_movies(session: Session) -> List[Movie]:
-    """Extract winner movies from session relationships."""
-    winners = []
-    if session.winner_slot1:
-        winners.append(session.winner_slot1)
-    if session.winner_slot2:
-        winners.append(session.winner_slot2)
-    return winners
-
-
-async def _return_to_sessions(message: Message, state: FSMContext) -> None:
+async def _return_to_sessions(
+    message: Message, state: FSMContext, db: AsyncSession,
+) -> None:
     """Return to sessions sub-menu."""
     await try_delete_message(message)
     await state.set_state(AdminMenuState.sessions_menu)
 
-    async with AsyncSessionLocal() as db:
-        session = await _get_active_session(db, await _get_admin_group_id(state))
-        if not session:
-            await replace_bot_message(
-                message, state,
-                "📋 <b>Сессии</b>\n\nНет активной сессии.",
-                reply_markup=get_admin_no_session_keyboard(),
-            )
-            return
-
-        text = await _format_session_info(db, session)
+    session = await _get_active_session(db, state)
+    if not session:
         await replace_bot_message(
             message, state,
-            text,
-            reply_markup=_get_session_keyboard(session.status),
+            _NO_SESSION_TEXT,
+            reply_markup=get_admin_no_session_keyboard(),
         )
+        return
+
+    text = await _format_session_info(db, session)
+    await replace_bot_message(
+        message, state,
+        text,
+        reply_markup=_get_session_keyboard(session.status),
+    )
 
 
 async def _send_movie_list_page(
     message: Message,
     state: FSMContext,
+    db: AsyncSession,
     page: int,
 ) -> None:
     """Send a page of the movie list with inline action buttons."""
-    async with AsyncSessionLocal() as db:
-        movies, total_pages = await get_movies_paginated(db, page, MOVIES_PER_PAGE)
-
-        if not movies:
-            await replace_bot_message(
-                message, state,
-                "ℹ️ Нет фильмов в базе данных.",
-                reply_markup=get_admin_movies_keyboard(),
-            )
-            return
+    movies, total_pages = await get_movies_paginated_lite(db, page, MOVIES_PER_PAGE)
 
-    # Delete old bot message
-    data = await state.get_data()
-    old_msg_id = data.get("bot_message_id")
-    if old_msg_id:
-        try:
-            await message.bot.delete_message(message.chat.id, old_msg_id)
-        except Exception:
-            pass
-
-    # Send each movie as a separate message with action buttons
-    for movie in movies:
-        text = _format_movie_card(movie)
-        await message.answer(
-            text,
-            reply_markup=get_admin_movie_actions_keyboard(movie.id, page),
+    if not movies:
+        await replace_bot_message(
+            message, state,
+            "ℹ️ Нет фильмов в базе данных.",
+            reply_markup=get_admin_movies_keyboard(),
         )
+        return
 
-    # Send pagination + back to movies menu
-    pagination = get_admin_movie_list_pagination(page, total_pages)
-    nav_msg = await message.answer(
+    await _send_movie_cards(
+        message, state, movies, page,
         f"📋 Страница {page}/{total_pages}",
-        reply_markup=pagination,
+        get_admin_movie_list_pagination(page, total_pages),
     )
+
+
+async def _send_movie_cards(
+    message: Message,
+    state: FSMContext,
+    movies: List[Row],
+    page: int,
+    nav_text: str,
+    nav_markup,
+) -> None:
+    """Replace the bot prompt with one card per movie and a nav message.
+
+    Cards are sent one by one to keep the listing order.  Only the
+    delete of the old prompt runs concurrently with them.  The nav
+    message is sent last, so it stays at the bottom and becomes the new
+    prompt.
+    """
+    data = await state.get_data()
+    old_msg_id = data.get("bot_message_id")
+    delete_old = (
+        asyncio.create_task(delete_bot_message(message, old_msg_id))
+        if old_msg_id else None
+    )
+    try:
+        for movie in movies:
+            await message.answer(
+                _format_movie_card(movie),
+                reply_markup=get_admin_movie_actions_keyboard(movie.id, page),
+            )
+    finally:
+        if delete_old is not None:
+            await delete_old
+
+    nav_msg = await message.answer(nav_text, reply_markup=nav_markup)
     await state.update_data(bot_message_id=nav_msg.message_id)
 
 
-def _format_movie_card(movie: Movie) -> str:
-    """Format a movie card for the admin movie list."""
+def _format_movie_card(movie: Row) -> str:
+    """Format a movie card from a movie card row (see repositories)."""
     year_str = format_year_suffix(movie.year)
     kp_rating = f"{movie.kinopoisk_rating:.1f}" if movie.kinopoisk_rating else "—"
     club = f"{movie.club_rating:.2f}" if movie.club_rating else "—"
@@ -1419,97 +1609,96 @@ def _format_movie_card(movie: Movie) -> str:
     )
 
 
-def _parse_batch_import(text: str) -> List[Tuple[str, float]]:
-    """Parse batch import text into list of (url, club_rating)."""
-    entries: List[Tuple[str, float]] = []
+def _inline_command_id(text: str, prefix: str) -> Optional[int]:
+    """Extract the movie id from an inline command like ``/del_movie_42``."""
+    suffix = text.removeprefix(prefix)
+    return int(suffix) if suffix.isdecimal() else None
 
-    for line in text.strip().split("\n"):
-        line = line.strip()
-        if not line:
-            continue
 
-        parts = line.rsplit(None, 1)
-        if len(parts) != 2:
-            continue
+def _parse_batch_import(text: str) -> List[Tuple[str, float]]:
+    """Parse batch import text into list of (url, club_rating)."""
+    return [
+        (url, rating)
+        for url, rating in (
+            (url, float(value.replace(",", ".")))
+            for url, value in _BATCH_LINE_RE.findall(text)
+        )
+        if 1.0 <= rating <= 10.0
+    ]
 
-        url, rating_str = parts
-        rating_str = rating_str.replace(",", ".")
 
+async def _fetch_batch_entry(
+    semaphore: asyncio.Semaphore, index: int, url: str, rating: float,
+) -> Tuple[int, Tuple[Optional[dict], Optional[str]]]:
+    """Fetch one batch import entry as (index, (movie_data, error_line))."""
+    async with semaphore:
         try:
-            rating = float(rating_str)
-            if not (1.0 <= rating <= 10.0):
-                continue
-        except ValueError:
-            continue
-
-        if "kinopoisk" not in url.lower():
-            continue
-
-        entries.append((url, rating))
-
-    return entries
+            movie_data = await parse_movie_data(url)
+        except KinopoiskParserError as e:
+            return index, (None, f"❌ {url}: {e}")
+    movie_data["club_rating"] = rating
+    return index, (movie_data, None)
 
 
 def _parse_ratings_input(text: str) -> List[Tuple[Optional[str], int]]:
     """Parse ratings input text into list of (username_or_none, rating)."""
-    ratings: List[Tuple[Optional[str], int]] = []
-
-    for line in text.split("\n"):
-        parts = line.strip().split()
-        if len(parts) == 2:
-            username, rating_str = parts
-            try:
-                rating = int(rating_str)
-                if 1 <= rating <= 10:
-                    ratings.append((username.lstrip("@"), rating))
-            except ValueError:
-                pass
-        elif len(parts) == 1:
-            try:
-                rating = int(parts[0])
-                if 1 <= rating <= 10:
-                    ratings.append((None, rating))
-            except ValueError:
-                pass
-
-    return ratings
+    # findall yields "" for a missing username group
+    return [
+        (username or None, rating)
+        for username, rating in (
+            (name, int(value)) for name, value in _RATING_LINE_RE.findall(text)
+        )
+        if 1 <= rating <= 10
+    ]
 
 
 async def _save_ratings_batch(
     db,
-    session_id: int,
     movie_id: int,
     ratings: List[Tuple[Optional[str], int]],
 ) -> int:
-    """Save a batch of ratings, creating placeholder users as needed."""
-    from bot.database.repositories import get_user_by_username
-
-    added = 0
-    for username, rating in ratings:
-        user = None
-        if username:
-            user = await get_user_by_username(db, username)
-
-        if not user:
-            user = User(
-                telegram_id=0,
-                username=username or f"User{added}",
-                first_name=username or f"User{added}",
-            )
-            db.add(user)
-            await db.flush()
+    """Save a batch of ratings, creating placeholder users as needed.
 
-        db.add(Rating(
-            session_id=session_id,
-            movie_id=movie_id,
-            user_id=user.id,
-            rating=rating,
-        ))
-        added += 1
-
-    return added
-
-
-def _escape_html(text: str) -> str:
-    """Escape HTML special characters for Telegram."""
-    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    The session id is taken from the movie row inside the INSERT, so a
+    missing movie inserts nothing and 0 is returned.
+    """
+    users_by_name = await get_users_by_usernames(
+        db, (username for username, _ in ratings if username),
+    )
+    user_ids = {name: user.id for name, user in users_by_name.items()}
+
+    missing = {
+        username for username, _ in ratings
+        if username and username not in user_ids
+    }
+    if missing:
+        user_ids.update(await get_or_create_placeholder_users(db, missing))
+
+    # Ratings without a username each get a fresh user, never a shared one
+    anonymous_ids = iter(await create_anonymous_users(db, [
+        f"User{index}"
+        for index, (username, _) in enumerate(ratings)
+        if not username
+    ]))
+    rows = [
+        (user_ids[username] if username else next(anonymous_ids), rating)
+        for username, rating in ratings
+    ]
+    if len(rows) > _COPY_RATINGS_THRESHOLD:
+        return await copy_movie_ratings(db, movie_id, rows)
+
+    new_ratings = values(
+        column("user_id", Integer), column("rating", Integer), name="new_ratings",
+    ).data(rows)
+
+    # INSERT ... SELECT validates the movie and inserts in one statement
+    result = await db.execute(
+        insert(Rating).from_select(
+            ["session_id", "movie_id", "user_id", "rating"],
+            select(
+                Movie.session_id, Movie.id,
+                new_ratings.c.user_id, new_ratings.c.rating,
+            ).where(Movie.id == movie_id),
+        )
+    )
+    return result.rowcount
@@ -1,6 +1,5 @@
 """Leaderboard handlers."""
 import logging
-import math
 from typing import List, Tuple, Optional
 
 from aiogram import Router, F
@@ -10,12 +9,13 @@ from aiogram.fsm.state import State, StatesGroup
 from sqlalchemy import select, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from bot.database.models import Session, Movie, Rating, User
+from bot.database.models import Session, Movie, Rating
 from bot.database.session import AsyncSessionLocal
-from bot.database.status_manager import get_status_by_code, STATUS_COMPLETED
+from bot.database.status_manager import get_status_id, STATUS_COMPLETED
 from bot.database.repositories import (
     resolve_telegram_group_id,
     get_group_by_telegram_id,
+    get_users_by_ids,
 )
 from bot.formatters import format_year_suffix, format_user_display_name
 from bot.keyboards import (
@@ -70,11 +70,11 @@ async def _query_winner_movies(
     Returns:
         (movies_data, total_pages, total_movies)
     """
-    completed_status = await get_status_by_code(db, STATUS_COMPLETED)
-    if not completed_status:
+    completed_status_id = await get_status_id(db, STATUS_COMPLETED)
+    if completed_status_id is None:
         return [], 0, 0
 
-    session_ids = await _get_completed_session_ids(db, group_id, completed_status.id)
+    session_ids = await _get_completed_session_ids(db, group_id, completed_status_id)
     if not session_ids:
         return [], 0, 0
 
@@ -84,7 +84,7 @@ async def _query_winner_movies(
     if total_movies == 0:
         return [], 0, 0
 
-    total_pages = math.ceil(total_movies / MOVIES_PER_PAGE)
+    total_pages = -(-total_movies // MOVIES_PER_PAGE)
 
     query = query.order_by(Movie.club_rating.desc().nullslast())
     offset = (page - 1) * MOVIES_PER_PAGE
@@ -133,8 +133,7 @@ def _build_leaderboard_query(session_ids: List[int], search_query: Optional[str]
     )
 
     if search_query:
-        search_pattern = f"%{search_query.lower()}%"
-        query = query.where(func.lower(Movie.title).like(search_pattern))
+        query = query.where(Movie.title.ilike(f"%{search_query}%"))
 
     return query
 
@@ -152,14 +151,12 @@ async def _enrich_with_proposers(
     offset: int,
 ) -> List[dict]:
     """Enrich movie rows with proposer names and ranking."""
+    proposers = await get_users_by_ids(db, (row[0].user_id for row in rows))
     movies_data = []
     for idx, row in enumerate(rows, start=offset + 1):
         movie, rating_count, avg_rating = row
 
-        result_user = await db.execute(
-            select(User).where(User.id == movie.user_id)
-        )
-        proposer = result_user.scalar_one()
+        proposer = proposers[movie.user_id]
         proposer_name = format_user_display_name(
             proposer.username, proposer.first_name,
         )
@@ -187,40 +184,38 @@ def format_leaderboard_message(
 ) -> str:
     """Format leaderboard message."""
     if search_query:
-        response = f"🔍 <b>Результаты поиска: \"{search_query}\"</b>\n\n"
+        header = f"🔍 <b>Результаты поиска: \"{search_query}\"</b>\n\n"
     else:
-        response = f"🏆 <b>ТАБЛИЦА ЛИДЕРОВ КИНОКЛУБА</b> (Страница {page}/{total_pages})\n\n"
+        header = f"🏆 <b>ТАБЛИЦА ЛИДЕРОВ КИНОКЛУБА</b> (Страница {page}/{total_pages})\n\n"
 
     if not movies_data:
-        return response + "Нет фильмов для отображения."
+        return header + "Нет фильмов для отображения."
 
+    parts = [header]
     for data in movies_data:
         rank = data['rank']
         movie = data['movie']
         rating_count = data['rating_count']
         avg_rating = data['avg_rating']
-        proposer_name = data['proposer_name']
 
         medal = {1: "🥇", 2: "🥈", 3: "🥉"}.get(rank, f"{rank}.")
         year_str = format_year_suffix(movie.year)
 
-        response += f"{medal} <b>{movie.title}</b>{year_str}\n"
+        parts.append(f"{medal} <b>{movie.title}</b>{year_str}\n")
 
         if rating_count > 0:
-            response += f"   ⭐ {avg_rating:.2f} ({rating_count} оценок)\n"
+            parts.append(f"   ⭐ {avg_rating:.2f} ({rating_count} оценок)\n\n")
         elif avg_rating and avg_rating > 0:
-            response += f"   ⭐ {avg_rating:.2f}\n"
+            parts.append(f"   ⭐ {avg_rating:.2f}\n\n")
         else:
-            response += "   Нет оценок\n"
-
-        response += "\n"
+            parts.append("   Нет оценок\n\n")
 
     if not search_query:
-        response += f"📊 Всего просмотрено: {total_movies} фильмов"
+        parts.append(f"📊 Всего просмотрено: {total_movies} фильмов")
     else:
-        response += f"\nНайдено: {len(movies_data)} фильм(ов)"
+        parts.append(f"\nНайдено: {len(movies_data)} фильм(ов)")
 
-    return response
+    return "".join(parts)
 
 
 # ── Handlers ─────────────────────────────────────────────────────────────
@@ -423,27 +418,26 @@ async def show_stats(message: Message, state: FSMContext) -> None:
 
 def _format_search_results(query: str, movies_data: List[dict]) -> str:
     """Format search results."""
-    response = f"🔍 <b>Результаты поиска: \"{query}\"</b>\n\n"
+    parts = [f"🔍 <b>Результаты поиска: \"{query}\"</b>\n\n"]
 
     for data in movies_data:
         movie = data['movie']
         rating_count = data['rating_count']
         avg_rating = data['avg_rating']
-        proposer_name = data['proposer_name']
 
         year_str = format_year_suffix(movie.year)
 
-        response += f"<b>{movie.title}</b>{year_str}\n"
+        parts.append(f"<b>{movie.title}</b>{year_str}\n")
 
         if rating_count > 0:
-            response += f"⭐ {avg_rating:.2f} ({rating_count} оценок)\n"
+            parts.append(f"⭐ {avg_rating:.2f} ({rating_count} оценок)\n")
         else:
-            response += "Нет оценок\n"
+            parts.append("Нет оценок\n")
 
-        response += f"#{data['rank']} в общем рейтинге\n\n"
+        parts.append(f"#{data['rank']} в общем рейтинге\n\n")
 
-    response += f"Найдено: {len(movies_data)} фильм(ов)"
-    return response
+    parts.append(f"Найдено: {len(movies_data)} фильм(ов)")
+    return "".join(parts)
 
 
 async def _collect_stats(
@@ -451,47 +445,44 @@ async def _collect_stats(
     group_id: int,
 ) -> Optional[dict]:
     """Collect all statistics for the group. Returns None if statuses not initialized."""
-    completed_status = await get_status_by_code(db, STATUS_COMPLETED)
-    if not completed_status:
+    completed_status_id = await get_status_id(db, STATUS_COMPLETED)
+    if completed_status_id is None:
         return None
 
-    total_sessions = (await db.execute(
+    completed_sessions = (
+        (Session.group_id == group_id) & (Session.status_id == completed_status_id)
+    )
+    # All four counts in one statement, so they share one snapshot
+    counts = (await db.execute(select(
         select(func.count(Session.id))
-        .where(Session.group_id == group_id)
-        .where(Session.status_id == completed_status.id)
-    )).scalar()
-
-    total_movies = (await db.execute(
+        .where(completed_sessions)
+        .scalar_subquery().label("sessions"),
         select(func.count(Movie.id))
         .join(Session, Movie.session_id == Session.id)
-        .where(Session.group_id == group_id)
-        .where(Session.status_id == completed_status.id)
+        .where(completed_sessions)
         .where(
             or_(
                 Movie.id == Session.winner_slot1_id,
                 Movie.id == Session.winner_slot2_id,
             )
         )
-    )).scalar()
-
-    total_participants = (await db.execute(
+        .scalar_subquery().label("movies"),
         select(func.count(func.distinct(Movie.user_id)))
         .join(Session, Movie.session_id == Session.id)
         .where(Session.group_id == group_id)
-    )).scalar()
-
-    total_ratings = (await db.execute(
+        .scalar_subquery().label("participants"),
         select(func.count(Rating.id))
         .join(Movie, Rating.movie_id == Movie.id)
         .join(Session, Movie.session_id == Session.id)
         .where(Session.group_id == group_id)
-    )).scalar()
+        .scalar_subquery().label("ratings"),
+    ))).one()
 
     return {
-        'sessions': total_sessions,
-        'movies': total_movies,
-        'participants': total_participants,
-        'ratings': total_ratings,
+        'sessions': counts.sessions,
+        'movies': counts.movies,
+        'participants': counts.participants,
+        'ratings': counts.ratings,
     }
 
 
@@ -246,10 +246,7 @@ async def handle_slot_selection(callback: CallbackQuery, state: FSMContext) -> N
             db.add(movie)
             await db.commit()
 
-            result = await db.execute(
-                select(Session).where(Session.id == session_id)
-            )
-            session = result.scalar_one()
+            session = await db.get(Session, session_id)
 
             await update_pinned_message(db, session, callback.message)
 
@@ -348,10 +345,7 @@ async def _check_duplicate(
     if not existing_movie:
         return None
 
-    result = await db.execute(
-        select(User).where(User.id == existing_movie.user_id)
-    )
-    proposer = result.scalar_one()
+    proposer = await db.get(User, existing_movie.user_id)
     proposer_name = (
         f"@{proposer.username}"
         if proposer.username
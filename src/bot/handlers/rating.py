@@ -10,7 +10,6 @@ The rating flow works as follows:
 3. The scoreboard shows who gave what rating to each movie.
 """
 import logging
-from datetime import datetime
 from typing import Dict, List, Optional
 
 from aiogram import Router, F
@@ -20,14 +19,15 @@ from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from bot.database.models import Session, Movie, Rating, User
+from bot.database.models import Session, Movie, Rating, User, UTC_NOW
 from bot.database.session import AsyncSessionLocal
-from bot.database.status_manager import get_status_by_code, STATUS_RATING, STATUS_COMPLETED
+from bot.database.status_manager import get_status_id, STATUS_RATING, STATUS_COMPLETED
 from bot.database.repositories import (
     resolve_telegram_group_id,
     get_group_by_telegram_id,
     get_active_session,
     get_or_create_user,
+    get_winner_movies,
     recalc_club_rating,
 )
 from bot.formatters import format_year_suffix, format_user_display_name
@@ -54,25 +54,6 @@ async def _get_active_rating_session(
     return await get_active_session(db, group.id, STATUS_RATING)
 
 
-async def _get_winner_movies(
-    db: AsyncSession,
-    session: Session,
-) -> List[Movie]:
-    """Return winner movies for the session, sorted by slot."""
-    winner_ids = [
-        wid
-        for wid in [session.winner_slot1_id, session.winner_slot2_id]
-        if wid is not None
-    ]
-    if not winner_ids:
-        return []
-
-    result = await db.execute(
-        select(Movie).where(Movie.id.in_(winner_ids))
-    )
-    return sorted(result.scalars().all(), key=lambda m: m.slot)
-
-
 async def _build_scoreboard_text(
     db: AsyncSession,
     session: Session,
@@ -165,9 +146,9 @@ async def _save_or_update_rating(
         ))
         action = "сохранена"
 
-    await db.commit()
+    await db.flush()
 
-    # Update the stored club_rating average
+    # Update the stored club_rating average; commits the rating as well
     await recalc_club_rating(db, movie_id)
 
     return action
@@ -193,7 +174,7 @@ async def rate_movies(message: Message, state: FSMContext) -> None:
                 )
                 return
 
-            movies = await _get_winner_movies(db, session)
+            movies = await get_winner_movies(db, session)
             if not movies:
                 await message.answer(
                     "⚠️ Не определены фильмы-победители. Завершите голосование."
@@ -287,7 +268,7 @@ async def complete_session(message: Message, state: FSMContext) -> None:
                 )
                 return
 
-            movies = await _get_winner_movies(db, session)
+            movies = await get_winner_movies(db, session)
             if not movies:
                 await message.answer("⚠️ Не определены фильмы-победители.")
                 return
@@ -302,13 +283,13 @@ async def complete_session(message: Message, state: FSMContext) -> None:
                 )
 
             # Mark session as completed
-            completed_status = await get_status_by_code(db, STATUS_COMPLETED)
-            if not completed_status:
+            completed_status_id = await get_status_id(db, STATUS_COMPLETED)
+            if completed_status_id is None:
                 await message.answer("❌ Ошибка: статусы не инициализированы.")
                 return
 
-            session.status_id = completed_status.id
-            session.completed_at = datetime.utcnow()
+            session.set_status(STATUS_COMPLETED, completed_status_id)
+            session.completed_at = UTC_NOW
             await db.commit()
 
             response += (
@@ -377,10 +358,7 @@ async def _validate_winner_movie(
     if movie_id not in winner_ids:
         return None
 
-    result = await db.execute(
-        select(Movie).where(Movie.id == movie_id)
-    )
-    return result.scalar_one_or_none()
+    return await db.get(Movie, movie_id)
 
 
 async def _refresh_scoreboard(
@@ -391,7 +369,7 @@ async def _refresh_scoreboard(
     """Refresh the scoreboard after a rating change."""
     if not session.rating_scoreboard_msg_id:
         return
-    movies = await _get_winner_movies(db, session)
+    movies = await get_winner_movies(db, session)
     await _update_scoreboard(
         callback.bot,
         callback.message.chat.id,
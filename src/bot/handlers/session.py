@@ -1,6 +1,6 @@
 """Session management handlers."""
 import logging
-from datetime import datetime
+from typing import Optional
 
 from aiogram import Router, F
 from aiogram.filters import Command
@@ -8,12 +8,13 @@ from aiogram.types import Message
 from aiogram.fsm.context import FSMContext
 
 from bot.config import config
-from bot.database.models import Session
+from bot.database.models import Session, UTC_NOW
 from bot.database.session import AsyncSessionLocal
 from bot.database.status_manager import (
-    get_status_by_code,
+    get_status_id,
     STATUS_COLLECTING,
     STATUS_COMPLETED,
+    STATUS_NAMES,
 )
 from bot.database.repositories import (
     get_or_create_user,
@@ -21,6 +22,7 @@ from bot.database.repositories import (
     get_group_by_telegram_id,
     get_active_session_any,
 )
+from bot.formatters import format_datetime
 from bot.keyboards import (
     BTN_NEW_SESSION, BTN_STATUS, BTN_CANCEL_SESSION,
     BTN_HELP, BTN_CANCEL, BTN_RATE,
@@ -48,17 +50,19 @@ async def cmd_start(message: Message) -> None:
 
 
 @router.message(F.text == BTN_CANCEL)
-async def handle_cancel(message: Message, state: FSMContext) -> None:
+async def handle_cancel(
+    message: Message, state: FSMContext, raw_state: Optional[str] = None,
+) -> None:
     """Cancel current FSM operation and return to main menu.
 
     Also cleans up any stored bot prompt message (e.g. from the
     proposal flow) and deletes the user's cancel message to keep
-    the chat tidy.
+    the chat tidy. ``raw_state`` is resolved once per update by the
+    FSM middleware, so logging it costs no extra storage read.
     """
-    current_state = await state.get_state()
     logger.info(
         "User %s cancelled action (state=%s)",
-        message.from_user.id, current_state,
+        message.from_user.id, raw_state,
     )
 
     data = await state.get_data()
@@ -108,14 +112,14 @@ async def create_new_session(message: Message, state: FSMContext) -> None:
                 await message.answer(
                     f"⚠️ Уже есть активная сессия!\n\n"
                     f"Статус: <b>{active_session.status}</b>\n"
-                    f"Создана: {active_session.created_at.strftime('%d.%m.%Y %H:%M')}\n\n"
+                    f"Создана: {format_datetime(active_session.created_at)}\n\n"
                     f"Нажмите «{BTN_STATUS}» для просмотра деталей."
                 )
                 return
             
             # Get collecting status
-            collecting_status = await get_status_by_code(db, STATUS_COLLECTING)
-            if not collecting_status:
+            collecting_status_id = await get_status_id(db, STATUS_COLLECTING)
+            if collecting_status_id is None:
                 await message.answer("❌ Ошибка: статусы не инициализированы.")
                 return
             
@@ -123,11 +127,11 @@ async def create_new_session(message: Message, state: FSMContext) -> None:
             new_session = Session(
                 group_id=group.id,
                 created_by=user.id,
-                status_id=collecting_status.id,
+                status_id=collecting_status_id,
+                status=STATUS_COLLECTING,
             )
             db.add(new_session)
             await db.commit()
-            await db.refresh(new_session)
             
             # Send and pin message for collecting proposals
             pin_message = await message.answer(
@@ -192,12 +196,12 @@ async def show_session_status(message: Message, state: FSMContext) -> None:
                 'rating': '⭐',
             }.get(session.status, 'ℹ️')
             
-            status_text = session.status_obj.name if session.status_obj else session.status
+            status_text = STATUS_NAMES.get(session.status, session.status)
             
             response = (
                 f"{status_emoji} <b>Статус текущей сессии</b>\n\n"
                 f"Состояние: <b>{status_text}</b>\n"
-                f"Создана: {session.created_at.strftime('%d.%m.%Y %H:%M')}\n"
+                f"Создана: {format_datetime(session.created_at)}\n"
             )
             
             if session.status == 'collecting':
@@ -235,13 +239,13 @@ async def cancel_session(message: Message, state: FSMContext) -> None:
                 return
 
             # Mark as completed
-            completed_status = await get_status_by_code(db, STATUS_COMPLETED)
-            if not completed_status:
+            completed_status_id = await get_status_id(db, STATUS_COMPLETED)
+            if completed_status_id is None:
                 await message.answer("❌ Ошибка: статусы не инициализированы.")
                 return
 
-            session.status_id = completed_status.id
-            session.completed_at = datetime.utcnow()
+            session.set_status(STATUS_COMPLETED, completed_status_id)
+            session.completed_at = UTC_NOW
             await db.commit()
             
             await message.answer(
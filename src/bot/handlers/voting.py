@@ -1,18 +1,17 @@
 """Voting handlers."""
-import json
 import logging
-from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
 from aiogram import Router, F
 from aiogram.types import Message, PollAnswer
 from aiogram.fsm.context import FSMContext
-from sqlalchemy import select, or_, delete
+from sqlalchemy import select, or_, delete, insert
+from sqlalchemy.orm import selectinload
 
-from bot.database.models import Session, Movie, Vote
+from bot.database.models import Session, Movie, Vote, UTC_NOW
 from bot.database.session import AsyncSessionLocal
 from bot.database.status_manager import (
-    get_status_by_code,
+    get_status_id,
     STATUS_COLLECTING,
     STATUS_VOTING,
     STATUS_RATING,
@@ -55,16 +54,16 @@ SLOT_ATTRS = {
 # ── Helpers ──────────────────────────────────────────────────────────────
 
 
-def _serialize_movie_ids(movies: List) -> str:
-    """Serialize a list of Movie objects to a JSON string of IDs."""
-    return json.dumps([m.id for m in movies])
+def _serialize_movie_ids(movies: List) -> List[int]:
+    """Return the IDs of Movie objects for the INTEGER[] poll mapping."""
+    return [m.id for m in movies]
 
 
-def _deserialize_movie_ids(raw: Optional[str]) -> List[int]:
-    """Deserialize a JSON string of movie IDs back to a list."""
+def _deserialize_movie_ids(raw: Optional[List[int]]) -> List[int]:
+    """Return stored poll movie IDs as a list (empty when unset)."""
     if not raw:
         return []
-    return json.loads(raw)
+    return list(raw)
 
 
 def _get_proposer_name(movie: Movie) -> str:
@@ -191,7 +190,7 @@ async def start_voting(message: Message, state: FSMContext) -> None:
 
             # Transition to voting
             await _transition_to_status(db, session, STATUS_VOTING)
-            session.voting_started_at = datetime.utcnow()
+            session.voting_started_at = UTC_NOW
             await db.commit()
 
             # Unpin collection message
@@ -261,15 +260,18 @@ async def handle_poll_answer(poll_answer: PollAnswer) -> None:
                 )
             )
 
-            # Create new votes for selected options
-            for option_idx in option_ids:
-                if option_idx < len(ordered_movies):
-                    movie = ordered_movies[option_idx]
-                    db.add(Vote(
-                        session_id=session.id,
-                        movie_id=movie.id,
-                        user_id=user.id,
-                    ))
+            # Create new votes for selected options in one INSERT
+            new_votes = [
+                {
+                    "session_id": session.id,
+                    "movie_id": ordered_movies[option_idx].id,
+                    "user_id": user.id,
+                }
+                for option_idx in option_ids
+                if option_idx < len(ordered_movies)
+            ]
+            if new_votes:
+                await db.execute(insert(Vote), new_votes)
 
             await db.commit()
 
@@ -416,6 +418,7 @@ async def _load_slot_movies(
         select(Movie)
         .where(Movie.session_id == session.id)
         .order_by(Movie.slot, Movie.created_at)
+        .options(selectinload(Movie.proposer))
     )
     all_movies = result.scalars().all()
     return {
@@ -430,6 +433,7 @@ async def _load_all_session_movies(db, session: Session) -> List[Movie]:
         select(Movie)
         .where(Movie.session_id == session.id)
         .order_by(Movie.slot, Movie.created_at)
+        .options(selectinload(Movie.proposer))
     )
     return list(result.scalars().all())
 
@@ -439,7 +443,9 @@ async def _load_movies_by_ids(
 ) -> List[Movie]:
     """Load movies by IDs preserving the order of movie_ids."""
     result = await db.execute(
-        select(Movie).where(Movie.id.in_(movie_ids))
+        select(Movie)
+        .where(Movie.id.in_(movie_ids))
+        .options(selectinload(Movie.proposer))
     )
     movies_by_id = {m.id: m for m in result.scalars().all()}
     return [movies_by_id[mid] for mid in movie_ids if mid in movies_by_id]
@@ -498,9 +504,9 @@ def _format_auto_results(auto_msgs: List[str]) -> str:
 
 async def _transition_to_status(db, session: Session, status_code: str) -> None:
     """Change session status and commit."""
-    status = await get_status_by_code(db, status_code)
-    if status:
-        session.status_id = status.id
+    status_id = await get_status_id(db, status_code)
+    if status_id is not None:
+        session.set_status(status_code, status_id)
     await db.commit()
 
 
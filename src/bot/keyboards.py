@@ -1,6 +1,8 @@
 """Keyboards for the bot (inline + reply)."""
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Tuple
 
+from aiogram.filters.callback_data import CallbackData
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton, ReplyKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder, ReplyKeyboardBuilder
 
@@ -66,6 +68,10 @@ BTN_ADM_MOVIE_SEARCH = "🔍 Найти фильм"
 
 # ── Reply keyboards ──────────────────────────────────────────────────────
 
+# Zero-argument keyboards never change at runtime, so each factory
+# builds its markup once and returns the cached object afterwards.
+
+@lru_cache(maxsize=None)
 def get_main_menu_keyboard() -> ReplyKeyboardMarkup:
     """Get the main menu reply keyboard.
 
@@ -94,6 +100,7 @@ def get_main_menu_keyboard() -> ReplyKeyboardMarkup:
     return builder.as_markup(resize_keyboard=True)
 
 
+@lru_cache(maxsize=None)
 def get_cancel_keyboard() -> ReplyKeyboardMarkup:
     """Get keyboard with only the cancel button (for FSM flows)."""
     builder = ReplyKeyboardBuilder()
@@ -101,6 +108,7 @@ def get_cancel_keyboard() -> ReplyKeyboardMarkup:
     return builder.as_markup(resize_keyboard=True)
 
 
+@lru_cache(maxsize=None)
 def get_revote_slot_keyboard() -> ReplyKeyboardMarkup:
     """Get keyboard for revote slot selection.
 
@@ -204,6 +212,13 @@ def get_leaderboard_pagination_keyboard(
     return builder.as_markup()
 
 
+class ConfirmCallback(CallbackData, prefix="confirm"):
+    """Yes/No confirmation callback: ``confirm:<action>:<decision>``."""
+
+    action: str
+    decision: str
+
+
 def get_confirmation_keyboard(action: str) -> InlineKeyboardMarkup:
     """Get confirmation keyboard (Yes/No).
 
@@ -211,8 +226,14 @@ def get_confirmation_keyboard(action: str) -> InlineKeyboardMarkup:
         action: Action identifier for callback data
     """
     builder = InlineKeyboardBuilder()
-    builder.button(text="✅ Да", callback_data=f"confirm:{action}:yes")
-    builder.button(text="❌ Нет", callback_data=f"confirm:{action}:no")
+    builder.button(
+        text="✅ Да",
+        callback_data=ConfirmCallback(action=action, decision="yes"),
+    )
+    builder.button(
+        text="❌ Нет",
+        callback_data=ConfirmCallback(action=action, decision="no"),
+    )
     builder.adjust(2)
     return builder.as_markup()
 
@@ -220,6 +241,7 @@ def get_confirmation_keyboard(action: str) -> InlineKeyboardMarkup:
 # ── Admin keyboards ──────────────────────────────────────────────────────
 
 
+@lru_cache(maxsize=None)
 def get_admin_menu_keyboard() -> ReplyKeyboardMarkup:
     """Main admin panel keyboard.
 
@@ -245,13 +267,17 @@ def get_admin_menu_keyboard() -> ReplyKeyboardMarkup:
     return builder.as_markup(resize_keyboard=True)
 
 
+@lru_cache(maxsize=4)
 def get_admin_group_selector_keyboard(
-    groups: List[Tuple[int, str]],
+    groups: Tuple[Tuple[int, str], ...],
 ) -> InlineKeyboardMarkup:
     """Inline keyboard for selecting a group in admin panel.
 
+    Cached on the (telegram_id, name) pairs, so a renamed group
+    simply produces a new cache entry.
+
     Args:
-        groups: list of (telegram_id, display_name) tuples
+        groups: tuple of (telegram_id, display_name) tuples
     """
     builder = InlineKeyboardBuilder()
     for telegram_id, name in groups:
@@ -260,6 +286,7 @@ def get_admin_group_selector_keyboard(
     return builder.as_markup()
 
 
+@lru_cache(maxsize=None)
 def get_admin_sessions_collecting_keyboard() -> ReplyKeyboardMarkup:
     """Admin session keyboard for 'collecting' status."""
     builder = ReplyKeyboardBuilder()
@@ -272,6 +299,7 @@ def get_admin_sessions_collecting_keyboard() -> ReplyKeyboardMarkup:
     return builder.as_markup(resize_keyboard=True)
 
 
+@lru_cache(maxsize=None)
 def get_admin_sessions_voting_keyboard() -> ReplyKeyboardMarkup:
     """Admin session keyboard for 'voting' status."""
     builder = ReplyKeyboardBuilder()
@@ -284,6 +312,7 @@ def get_admin_sessions_voting_keyboard() -> ReplyKeyboardMarkup:
     return builder.as_markup(resize_keyboard=True)
 
 
+@lru_cache(maxsize=None)
 def get_admin_sessions_rating_keyboard() -> ReplyKeyboardMarkup:
     """Admin session keyboard for 'rating' status."""
     builder = ReplyKeyboardBuilder()
@@ -296,6 +325,7 @@ def get_admin_sessions_rating_keyboard() -> ReplyKeyboardMarkup:
     return builder.as_markup(resize_keyboard=True)
 
 
+@lru_cache(maxsize=None)
 def get_admin_no_session_keyboard() -> ReplyKeyboardMarkup:
     """Admin keyboard when no active session exists."""
     builder = ReplyKeyboardBuilder()
@@ -303,6 +333,7 @@ def get_admin_no_session_keyboard() -> ReplyKeyboardMarkup:
     return builder.as_markup(resize_keyboard=True)
 
 
+@lru_cache(maxsize=None)
 def get_admin_movies_keyboard() -> ReplyKeyboardMarkup:
     """Admin movies submenu keyboard.
 
@@ -318,6 +349,7 @@ def get_admin_movies_keyboard() -> ReplyKeyboardMarkup:
     return builder.as_markup(resize_keyboard=True)
 
 
+@lru_cache(maxsize=None)
 def get_admin_back_keyboard() -> ReplyKeyboardMarkup:
     """Keyboard with only the back button."""
     builder = ReplyKeyboardBuilder()
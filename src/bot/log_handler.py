@@ -5,6 +5,7 @@ so they can be retrieved on demand without writing to disk.
 """
 import logging
 from collections import deque
+from itertools import islice
 from typing import List
 
 # Singleton deque shared across the module
@@ -23,6 +24,11 @@ class InMemoryLogHandler(logging.Handler):
 
 
 def get_recent_logs(n: int = 50) -> List[str]:
-    """Return the last *n* log lines (oldest first)."""
-    items = list(_LOG_BUFFER)
-    return items[-n:]
+    """Return the last *n* log lines (oldest first).
+
+    Walks the buffer from its newest end, so only *n* entries are
+    copied rather than the whole deque.
+    """
+    items = list(islice(reversed(_LOG_BUFFER), n))
+    items.reverse()
+    return items
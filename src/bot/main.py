@@ -3,6 +3,11 @@ import asyncio
 import logging
 import sys
 
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
@@ -11,10 +16,11 @@ from aiogram.types import BotCommand, BotCommandScopeAllGroupChats, BotCommandSc
 from bot.config import config
 from bot.middlewares import (
     AccessCheckMiddleware,
+    DbSessionMiddleware,
     PollAnswerLoggingMiddleware,
     ErrorLoggingMiddleware,
 )
-from bot.database import init_db
+from bot.database import init_db, prewarm_pool
 from bot.log_handler import InMemoryLogHandler
 
 # Import handlers
@@ -73,6 +79,7 @@ async def main() -> None:
     # Initialize database
     try:
         await init_db()
+        await prewarm_pool()
         logger.info("Database initialized successfully")
     except Exception as e:
         logger.error("Database initialization error: %s", e)
@@ -113,6 +120,10 @@ async def main() -> None:
     dp.include_router(leaderboard.router)
     dp.include_router(admin.router)
 
+    # Admin handlers receive a per-update database session as ``db``
+    admin.router.message.middleware(DbSessionMiddleware())
+    admin.router.callback_query.middleware(DbSessionMiddleware())
+
     logger.info("Starting bot...")
     
     # Start polling
@@ -123,8 +134,10 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    # uvloop speeds up the event loop and asyncpg's socket I/O
+    run = uvloop.run if uvloop else asyncio.run
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
     except Exception as e:
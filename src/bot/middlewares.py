@@ -6,6 +6,7 @@ from aiogram import BaseMiddleware
 from aiogram.types import Message, CallbackQuery, PollAnswer
 
 from bot.config import config
+from bot.database.session import AsyncSessionLocal
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +51,7 @@ class AccessCheckMiddleware(BaseMiddleware):
 
         # Check for group/supergroup chats
         if chat_type in ['group', 'supergroup']:
-            if chat.id not in config.GROUP_IDS:
+            if chat.id not in config.GROUP_ID_SET:
                 logger.warning(
                     "Rejected: unauthorized group chat_id=%d user_id=%d",
                     chat.id,
@@ -192,6 +193,27 @@ class ErrorLoggingMiddleware(BaseMiddleware):
             raise
 
 
+class DbSessionMiddleware(BaseMiddleware):
+    """Middleware that opens one database session per handled update.
+
+    The session is passed to the handler as the ``db`` keyword argument
+    and closed afterwards; uncommitted work is rolled back on close.
+    Handlers stay responsible for calling ``commit()``.  Register it as
+    an inner (handler) middleware so a session is only opened for
+    updates that actually matched a handler.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[Message | CallbackQuery, Dict[str, Any]], Awaitable[Any]],
+        event: Message | CallbackQuery,
+        data: Dict[str, Any],
+    ) -> Any:
+        async with AsyncSessionLocal() as db:
+            data["db"] = db
+            return await handler(event, data)
+
+
 def _extractThreadId(event: Message | CallbackQuery) -> Optional[int]:
     """Extract message_thread_id from a Message or CallbackQuery."""
     if isinstance(event, Message):
@@ -5,11 +5,12 @@ Uses Kinopoisk GraphQL API (graphql.kinopoisk.ru) for fast, structured data retr
 import json
 import re
 import logging
+import time
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 from urllib.parse import urlparse
 
 import aiohttp
-from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +47,12 @@ _POSTER_SIZE = "300x450"
 # Timeout for HTTP requests (seconds)
 _HTTP_TIMEOUT = 15
 
+# Parsed movies by Kinopoisk ID: (fetched_at, movie_data), oldest first.
+# Keyed by ID so URL variants (trailing slash, query) share an entry.
+_MOVIE_CACHE: "OrderedDict[str, tuple[float, Dict[str, Any]]]" = OrderedDict()
+_MOVIE_CACHE_TTL = 24 * 60 * 60
+_MOVIE_CACHE_SIZE = 512
+
 # ── Exceptions ───────────────────────────────────────────────────────────
 
 
@@ -213,15 +220,6 @@ async def _fetch_movie_via_graphql(kinopoisk_id: str) -> Dict[str, Any]:
                         "Ошибка GraphQL Кинопоиска"
                     )
 
-                data = body.get("data")
-                if not data:
-                    raise KinopoiskParserError(
-                        "Пустой ответ от GraphQL Кинопоиска"
-                    )
-
-                result = _parse_graphql_response(data, kinopoisk_id)
-                return result
-
     except KinopoiskParserError:
         raise
     except Exception as exc:
@@ -230,6 +228,22 @@ async def _fetch_movie_via_graphql(kinopoisk_id: str) -> Dict[str, Any]:
             "Не удалось получить данные фильма с Кинопоиска"
         ) from exc
 
+    # Build the movie dict after the HTTP session is closed
+    try:
+        data = body.get("data")
+        if not data:
+            raise KinopoiskParserError(
+                "Пустой ответ от GraphQL Кинопоиска"
+            )
+        return _parse_graphql_response(data, kinopoisk_id)
+    except KinopoiskParserError:
+        raise
+    except Exception as exc:
+        logger.error("GraphQL response parsing failed: %s", exc)
+        raise KinopoiskParserError(
+            "Не удалось разобрать ответ Кинопоиска"
+        ) from exc
+
 
 # ── Public API ───────────────────────────────────────────────────────────
 
@@ -237,6 +251,8 @@ async def _fetch_movie_via_graphql(kinopoisk_id: str) -> Dict[str, Any]:
 async def parse_movie_data(url: str) -> Dict[str, Any]:
     """Parse movie data from Kinopoisk URL via GraphQL API.
 
+    Results are cached in-process for 24 hours per Kinopoisk ID.
+
     Returns:
         Dictionary with movie data
 
@@ -250,9 +266,19 @@ async def parse_movie_data(url: str) -> Dict[str, Any]:
     if not kinopoisk_id:
         raise KinopoiskParserError("Не удалось извлечь ID фильма из URL")
 
+    cached = _MOVIE_CACHE.get(kinopoisk_id)
+    if cached is not None and time.monotonic() - cached[0] < _MOVIE_CACHE_TTL:
+        # Callers add their own keys to the dict, so hand out a copy
+        return dict(cached[1])
+
     result = await _fetch_movie_via_graphql(kinopoisk_id)
     logger.info("Movie '%s' fetched via GraphQL", result.get('title'))
-    return result
+
+    _MOVIE_CACHE[kinopoisk_id] = (time.monotonic(), result)
+    _MOVIE_CACHE.move_to_end(kinopoisk_id)
+    if len(_MOVIE_CACHE) > _MOVIE_CACHE_SIZE:
+        _MOVIE_CACHE.popitem(last=False)
+    return dict(result)
 
 
 async def format_movie_info(movie_data: Dict[str, Any]) -> str:
@@ -10,6 +10,7 @@ The ``↩️ Отмена`` handler in session.py already reads ``bot_message_id
 on cancel, so all flows that use these helpers get proper cancel cleanup
 for free.
 """
+import asyncio
 import logging
 
 from aiogram.types import Message
@@ -31,35 +32,70 @@ async def replace_bot_message(
     state: FSMContext,
     text: str,
     reply_markup=None,
-) -> None:
+) -> Message:
     """Replace the bot's prompt message with new content.
 
     Deletes the previous bot message (tracked via ``bot_message_id``
     in FSM data) and sends a fresh one.  The new message ID is written
-    back to FSM so later calls stay consistent.
+    back to FSM so later calls stay consistent.  Returns the new message.
 
     Can be called with ``callback.message`` as the *message* parameter
     when handling inline-button callbacks.
     """
-    data = await state.get_data()
-    bot_message_id = data.get("bot_message_id")
+    return await _replace(message, state, text, reply_markup)
 
-    if bot_message_id:
-        try:
-            await message.bot.delete_message(
-                chat_id=message.chat.id,
-                message_id=bot_message_id,
-            )
-        except Exception as exc:
-            logger.warning(
-                "Failed to delete message %s in chat %s: %s",
-                bot_message_id,
-                message.chat.id,
-                exc,
-            )
 
-    new_msg = await message.answer(text, reply_markup=reply_markup)
+async def swap_ui(
+    message: Message,
+    state: FSMContext,
+    text: str,
+    reply_markup=None,
+) -> None:
+    """Delete the user's *message* and replace the bot's prompt.
+
+    Equivalent to :func:`try_delete_message` followed by
+    :func:`replace_bot_message`, but both deletions and the new send
+    go out concurrently instead of as three sequential API calls.
+    """
+    await _replace(message, state, text, reply_markup, try_delete_message(message))
+
+
+async def _replace(
+    message: Message,
+    state: FSMContext,
+    text: str,
+    reply_markup,
+    *extra,
+) -> Message:
+    """Send the new prompt alongside the old prompt's deletion and *extra*."""
+    bot_message_id = (await state.get_data()).get("bot_message_id")
+
+    # The Telegram calls are independent of each other, so run them
+    # concurrently rather than paying one round-trip per call
+    calls = [message.answer(text, reply_markup=reply_markup), *extra]
+    if bot_message_id:
+        calls.append(delete_bot_message(message, bot_message_id))
+    new_msg = (await asyncio.gather(*calls))[0]
+    # update_data (not set_data with the snapshot above) so FSM data
+    # written by another update during the Telegram calls is kept
     await state.update_data(bot_message_id=new_msg.message_id)
+    return new_msg
+
+
+async def delete_bot_message(message: Message, message_id: int) -> None:
+    """Delete bot message *message_id* in *message*'s chat, logging failures."""
+    try:
+        await message.bot.delete_message(
+            chat_id=message.chat.id,
+            message_id=message_id,
+        )
+    except Exception as exc:
+        logger.warning(
+            "Failed to delete message %s in chat %s: %s",
+            message_id,
+            message.chat.id,
+            exc,
+        )
 
 
 async def abort_flow(